@@ -1,11 +1,16 @@
 """Audio processing and optimization for TTS engine."""
 
+import struct
 from typing import TypedDict
 
 from loguru import logger
 
 from .config import Config
 
+# 16-bit PCM WAV header: RIFF chunk, fmt subchunk and data subchunk header (44 bytes)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_BITS_PER_SAMPLE = 16
+
 
 class AudioQuery(TypedDict, total=False):
     """TypedDict for audio query parameters with optional fields."""
@@ -74,36 +79,22 @@ class AudioProcessor:
             WAV header as bytes
 
         """
-        import struct
-
-        # WAV file constants
-        bits_per_sample = 16  # 16-bit PCM
-        byte_rate = sample_rate * channels * (bits_per_sample // 8)
-        block_align = channels * (bits_per_sample // 8)
-
-        # WAV header structure
-        header = struct.pack(
-            "<4sL4s",  # RIFF header
+        block_align = channels * (WAV_BITS_PER_SAMPLE // 8)
+        return _WAV_HEADER.pack(
             b"RIFF",  # Chunk ID
             36 + data_size,  # Chunk size
-            b"WAVE",
-        )  # Format
-
-        header += struct.pack(
-            "<4sLHHLLHH",  # fmt subchunk
+            b"WAVE",  # Format
             b"fmt ",  # Subchunk1 ID
             16,  # Subchunk1 size
             1,  # Audio format (PCM)
             channels,  # Number of channels
             sample_rate,  # Sample rate
-            byte_rate,  # Byte rate
+            sample_rate * block_align,  # Byte rate
             block_align,  # Block align
-            bits_per_sample,
-        )  # Bits per sample
-
-        header += struct.pack("<4sL", b"data", data_size)  # data subchunk header  # Subchunk2 ID  # Subchunk2 size
-
-        return header
+            WAV_BITS_PER_SAMPLE,  # Bits per sample
+            b"data",  # Subchunk2 ID
+            data_size,  # Subchunk2 size
+        )
 
     def validate_audio_data(self, audio_data: bytes) -> bool:
         """Validate audio data integrity.
@@ -41,6 +41,7 @@ class Config:
     debug: bool
     test_mode: bool
     enable_self_message_processing: bool
+    tts_cache_bytes: bool = False
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -98,4 +99,5 @@ class Config:
             debug=os.environ.get("DEBUG", "false").lower() in ["true", "1", "yes"],
             test_mode=os.environ.get("TEST_MODE", "false").lower() in ["true", "1", "yes"],
             enable_self_message_processing=os.environ.get("ENABLE_SELF_MESSAGE_PROCESSING", "false").lower() in ["true", "1", "yes"],
+            tts_cache_bytes=os.environ.get("TTS_CACHE_BYTES", "false").lower() in ["true", "1", "yes"],
         )
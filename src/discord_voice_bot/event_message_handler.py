@@ -25,9 +25,10 @@ class MessageHandler:
     async def handle_message(self, message: discord.Message) -> None:
         """Handle message events with proper filtering and validation."""
         try:
-            # Log all messages for debugging (rate limited)
-            logger.debug(f"🔵 RECEIVED message from {message.author.name} (ID: {message.id}) in channel {message.channel.id}: '{message.content[:50]}'")
-            logger.debug(f"🔵 Message details - Type: {message.type}, Author bot: {message.author.bot}, Content length: {len(message.content)}")
+            # Log all messages for debugging; lazy so nothing is formatted when debug is off
+            lazy = logger.opt(lazy=True)
+            lazy.debug("🔵 RECEIVED message from {} (ID: {}) in channel {}: '{}'", lambda: message.author.name, lambda: message.id, lambda: message.channel.id, lambda: message.content[:50])
+            lazy.debug("🔵 Message details - Type: {}, Author bot: {}, Content length: {}", lambda: message.type, lambda: message.author.bot, lambda: len(message.content))
 
             # Process commands first (with rate limiting) - BEFORE TTS filtering
             logger.debug("🟡 STEP 1: Processing commands for message")
@@ -373,21 +373,21 @@ class MessageProcessor:
             Dictionary with processed message data, or None if shouldn't be processed
 
         """
-        logger.debug(f"📝 PROCESSOR: process_message called for {message.author.display_name}: '{message.content[:50]}'")
-        logger.debug(f"📝 PROCESSOR: Message ID: {message.id}, Channel ID: {message.channel.id}")
+        # Lazy so the previews are only built when debug logging is on
+        lazy = logger.opt(lazy=True)
+        lazy.debug("📝 PROCESSOR: process_message called for {}: '{}'", lambda: message.author.display_name, lambda: message.content[:50])
+        lazy.debug("📝 PROCESSOR: Message ID: {}, Channel ID: {}", lambda: message.id, lambda: message.channel.id)
 
         tts_text = await self.create_tts_message(message, bot_user_id)
         if not tts_text:
             logger.debug("📝 PROCESSOR: create_tts_message returned None - message filtered out")
             return None
 
-        logger.debug(f"📝 PROCESSOR: TTS text created: '{tts_text[:50]}...'")
+        lazy.debug("📝 PROCESSOR: TTS text created: '{}...'", lambda: tts_text[:50])
 
         # Chunk the message
         chunks = self.chunk_message(tts_text)
-        logger.debug(f"📝 PROCESSOR: Message chunked into {len(chunks)} pieces")
-        for i, chunk in enumerate(chunks):
-            logger.debug(f"📝 PROCESSOR: Chunk {i + 1}: '{chunk[:30]}...'")
+        lazy.debug("📝 PROCESSOR: Message chunked into {} pieces: {}", lambda: len(chunks), lambda: [chunk[:30] for chunk in chunks])
 
         result = {
             "text": tts_text,
@@ -397,7 +397,7 @@ class MessageProcessor:
             "group_id": f"msg_{message.id}",
         }
 
-        logger.debug(f"📝 PROCESSOR: Returning processed message with keys: {list(result.keys())}")
+        lazy.debug("📝 PROCESSOR: Returning processed message with keys: {}", lambda: list(result))
         logger.info(f"📝 PROCESSOR: Successfully processed message from {message.author.display_name} into {len(chunks)} chunks")
         return result
 
@@ -13,7 +13,7 @@ async def create_voices_embed(
 ) -> discord.Embed:
     """Create voices embed showing available speakers."""
     try:
-        speakers = await tts_engine.get_available_speakers()
+        speakers = tts_engine.get_available_speakers()
 
         # Get user's current setting
         user_id_str = str(user_id)
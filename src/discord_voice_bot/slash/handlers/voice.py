@@ -58,7 +58,7 @@ async def handle(interaction: discord.Interaction, bot: DiscordVoiceTTSBot, spea
 
         config = bot.config
         tts_engine = await get_tts_engine(config)
-        speakers = await tts_engine.get_available_speakers()
+        speakers = tts_engine.get_available_speakers()
 
         # Find matching speaker (case-insensitive)
         speaker_lower = speaker.lower()
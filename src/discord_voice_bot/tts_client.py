@@ -10,6 +10,15 @@ from loguru import logger
 
 from .config import Config
 
+# The synthesizer worker sends one request at a time; the second connection
+# keeps a health probe or speaker lookup from waiting behind it
+CONNECTIONS_PER_HOST = 2
+
+# Connection pool shared by every request for the lifetime of the session
+CONNECTION_LIMIT = 32
+KEEPALIVE_TIMEOUT = 75  # seconds an idle keep-alive connection is kept
+DNS_CACHE_TTL = 300  # seconds
+
 
 class TTSClient:
     """Manages TTS API communication and requests."""
@@ -18,6 +27,12 @@ class TTSClient:
         """Initialize TTS client with a configuration object."""
         self.config = config
         self._session: aiohttp.ClientSession | None = None
+        # Config and engine URLs the current session was opened against
+        self._session_config: Config | None = None
+        self._session_urls: tuple[str, ...] = ()
+        # Speaker ID resolved for the config object it was computed from
+        self._speaker_config: Config | None = None
+        self._speaker_id: int | None = None
 
     @property
     def api_url(self) -> str:
@@ -32,7 +47,16 @@ class TTSClient:
     @property
     def speaker_id(self) -> int:
         """Get current speaker ID from config."""
-        val = str(self.config.tts_speaker).strip()
+        # Config is immutable, so the resolved ID only changes with the object
+        if self.config is self._speaker_config and self._speaker_id is not None:
+            return self._speaker_id
+        self._speaker_id = self._resolve_speaker_id()
+        self._speaker_config = self.config
+        return self._speaker_id
+
+    def _resolve_speaker_id(self) -> int:
+        """Resolve the configured speaker to a numeric ID."""
+        val = self.config.tts_speaker.strip()
         if val.isdigit():
             return int(val)
         engines = self.config.engines
@@ -56,7 +80,15 @@ class TTSClient:
         if not self._session:
             logger.debug("🔗 Creating new aiohttp ClientSession for TTS client")
             timeout = aiohttp.ClientTimeout(total=10, connect=2)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            self._session_config = self.config
+            self._session_urls = self._engine_urls()
             logger.debug("✅ aiohttp ClientSession created successfully")
 
     async def close_session(self) -> None:
@@ -64,9 +96,37 @@ class TTSClient:
         if self._session:
             logger.debug("🔗 Closing aiohttp ClientSession for TTS client")
             await self._session.close()
+            # Give the connector a loop iteration to release its transports
+            await asyncio.sleep(0)
             self._session = None
+            self._session_config = None
+            self._session_urls = ()
             logger.debug("✅ aiohttp ClientSession closed successfully")
 
+    def _engine_urls(self) -> tuple[str, ...]:
+        """Get the configured URL of every engine, in config order."""
+        return tuple(str(engine_cfg.get("url", "")) for engine_cfg in self.config.engines.values())
+
+    async def ensure_session(self) -> aiohttp.ClientSession:
+        """Get an open session bound to the current engine URLs.
+
+        Config is immutable, so a changed engine URL always arrives as a new
+        Config object. When that happens the pooled connections point at the
+        old hosts, so the session is rebuilt instead of reused.
+        """
+        if self._session is not None and self.config is not self._session_config:
+            if self._engine_urls() != self._session_urls:
+                logger.info("🔗 TTS engine URLs changed, recreating aiohttp ClientSession")
+                await self.close_session()
+            else:
+                self._session_config = self.config
+
+        if self._session is None:
+            await self.start_session()
+
+        assert self._session is not None  # Type guard for mypy
+        return self._session
+
     async def check_api_availability(self) -> tuple[bool, str]:
         """Check TTS API availability with detailed error information.
 
@@ -74,12 +134,10 @@ class TTSClient:
             (is_available, error_detail): Tuple of availability status and error description
 
         """
-        if not self._session:
-            await self.start_session()
+        session = await self.ensure_session()
 
         try:
-            assert self._session is not None  # Type guard for mypy
-            async with self._session.get(f"{self.api_url}/version") as response:
+            async with session.get(f"{self.api_url}/version") as response:
                 if response.status == 200:
                     logger.debug(f"{self.engine_name} TTS API is available")
                     return True, ""
@@ -119,8 +177,8 @@ class TTSClient:
             params = {"text": text, "speaker": speaker_id}
             url = f"{api_url}/audio_query?" + urllib.parse.urlencode(params)
 
-            assert self._session is not None  # Type guard for mypy
-            async with self._session.post(url) as response:
+            session = await self.ensure_session()
+            async with session.post(url) as response:
                 if response.status != 200:
                     logger.error(f"Audio query failed with status {response.status}")
                     return None
@@ -150,8 +208,8 @@ class TTSClient:
             headers = {"Content-Type": "application/json"}
             data = json.dumps(audio_query).encode("utf-8")
 
-            assert self._session is not None  # Type guard for mypy
-            async with self._session.post(url, data=data, headers=headers) as response:
+            session = await self.ensure_session()
+            async with session.post(url, data=data, headers=headers) as response:
                 if response.status != 200:
                     logger.error(f"Audio synthesis failed with status {response.status}")
                     return None
@@ -179,8 +237,7 @@ class TTSClient:
             logger.debug("Empty text provided, returning None")
             return None
 
-        if not self._session:
-            await self.start_session()
+        _ = await self.ensure_session()
 
         # Determine engine and speaker
         target_engine = (engine_name or self.config.tts_engine).lower()
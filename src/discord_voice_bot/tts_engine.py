@@ -1,17 +1,31 @@
 """TTS Engine integration for Discord Voice TTS Bot."""
 
+import asyncio
+import copy
+import hashlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 __all__ = ["TTSEngine", "TTSEngineError", "get_tts_engine"]
 
 from loguru import logger
 
+from .audio_debugger import audio_debugger
 from .audio_processor import AudioProcessor, AudioQuery
 from .config import Config
 from .temp_file_manager import TempFileManager
 from .tts_client import TTSClient
 from .tts_health_monitor import TTSHealthMonitor
 
+# Entries kept by each LRU cache (audio queries and, optionally, audio bytes)
+CACHE_MAXSIZE = 256
+
+CacheKey = tuple[str, int, bytes]
+
+_NO_SPEAKERS: Mapping[str, Any] = MappingProxyType({})
+
 
 class TTSEngineError(Exception):
     """Exception raised when TTS engine encounters an error."""
@@ -34,6 +48,22 @@ class TTSEngine:
         # Engine state management
         self._started = False
 
+        # LRU caches keyed by (engine, speaker_id, text digest)
+        self._query_cache: OrderedDict[CacheKey, AudioQuery] = OrderedDict()
+        self._audio_cache: OrderedDict[CacheKey, bytes] = OrderedDict()
+
+        # Engine resolution per (engine_name, speaker_id) override, valid for one Config
+        self._engine_cache: dict[tuple[str | None, int | None], tuple[str, int, str]] = {}
+        self._engine_cache_config: Config | None = None
+
+        # Read-only speaker table for the configured engine, built in start()
+        self._speakers: Mapping[str, int] = _NO_SPEAKERS
+        self._speakers_config: Config | None = None
+
+        # Background debug-audio saves, kept referenced until they finish
+        self._debug_tasks: set[asyncio.Task[None]] = set()
+        self._debug_lock = asyncio.Lock()
+
         # Backward compatibility: direct access to session for testing
         self._session = None
 
@@ -65,12 +95,22 @@ class TTSEngine:
         """Start the TTS engine session."""
         if not self._started:
             await self._tts_client.start_session()
+            self._load_speakers()
             self._started = True
             self._session = self._tts_client.session  # Update session reference
             logger.info("🎵 TTS Engine started successfully")
 
+    async def _ensure_started(self) -> None:
+        """Start the engine on first use so every request shares one session."""
+        if not self._started:
+            logger.debug("Engine not started, starting automatically...")
+            await self.start()
+
     async def close(self) -> None:
         """Close the TTS engine session."""
+        if self._debug_tasks:
+            _ = await asyncio.gather(*self._debug_tasks, return_exceptions=True)
+        self.clear_caches()
         if self._started:
             await self._tts_client.close_session()
             self._started = False
@@ -84,6 +124,7 @@ class TTSEngine:
             (is_available, error_detail): Tuple of availability status and error description
 
         """
+        await self._ensure_started()
         return await self._tts_client.check_api_availability()
 
     async def synthesize_audio(self, text: str, speaker_id: int | None = None, engine_name: str | None = None) -> bytes | None:
@@ -105,10 +146,15 @@ class TTSEngine:
             logger.debug("Empty text provided, returning None")
             return None
 
-        # Ensure engine is started
-        if not self._started:
-            logger.debug("Engine not started, starting automatically...")
-            await self.start()
+        await self._ensure_started()
+
+        audio_key = self._cache_key(text, speaker_id, engine_name) if self.config.tts_cache_bytes else None
+        if audio_key is not None:
+            cached_audio = self._audio_cache.get(audio_key)
+            if cached_audio is not None:
+                self._audio_cache.move_to_end(audio_key)
+                logger.debug(f"Audio cache hit for text: '{text[:50]}...'")
+                return cached_audio
 
         try:
             # Generate audio query using TTS client
@@ -116,7 +162,8 @@ class TTSEngine:
             if not audio_query:
                 return None
 
-            # Optimize audio parameters for Discord
+            # Optimize audio parameters for Discord; this must land before the
+            # synthesis request because the server reads the adjusted fields
             self._audio_processor.optimize_audio_parameters(audio_query)
 
             # Synthesize audio using TTS client
@@ -124,19 +171,17 @@ class TTSEngine:
             if not audio_data:
                 return None
 
-            # DEBUG: Save raw TTS output for analysis
-            try:
-                from .audio_debugger import audio_debugger
-
+            # DEBUG: Save raw TTS output for analysis without holding up the caller
+            if self.config.debug:
                 metadata = {
                     "speaker_id": speaker_id or self.speaker_id,
                     "engine": engine_name or self.engine_name,
                     "original_length": len(text),
                 }
-                saved_path = audio_debugger.save_audio_stage(audio_data, "tts_raw", text, metadata)
-                logger.debug(f"🔍 Saved raw TTS audio for debugging: {saved_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save debug audio: {e}")
+                self._schedule_debug_save(audio_data, text, metadata)
+
+            if audio_key is not None:
+                self._cache_put(self._audio_cache, audio_key, audio_data)
 
             logger.info(f"Successfully synthesized audio for text: '{text[:50]}...'")
             return audio_data
@@ -145,31 +190,84 @@ class TTSEngine:
             logger.error(f"Failed to synthesize audio: {type(e).__name__} - {e!s}")
             return None
 
-    async def _generate_audio_query(self, text: str, speaker_id: int | None = None, engine_name: str | None = None) -> AudioQuery | None:
-        """Generate audio query from text using TTS client."""
-        # Determine engine and speaker
-        target_engine = engine_name or self.config.tts_engine
-        engines = self.config.engines
-        engine_config = engines.get(target_engine, engines["voicevox"])
+    def _schedule_debug_save(self, audio_data: bytes, text: str, metadata: dict[str, Any]) -> None:
+        """Save raw TTS audio for debugging in the background."""
+        task = asyncio.create_task(self._save_debug_audio(audio_data, text, metadata))
+        self._debug_tasks.add(task)
+        task.add_done_callback(self._debug_tasks.discard)
 
-        # Use provided speaker ID or engine default
-        current_speaker_id = speaker_id or engine_config["default_speaker"]
-        target_api_url = engine_config["url"]
+    async def _save_debug_audio(self, audio_data: bytes, text: str, metadata: dict[str, Any]) -> None:
+        """Write debug audio off the event loop; ffprobe analysis can take seconds."""
+        try:
+            # The debugger's session log is not thread-safe, so saves run one at a time
+            async with self._debug_lock:
+                saved_path = await asyncio.to_thread(audio_debugger.save_audio_stage, audio_data, "tts_raw", text, metadata)
+            logger.debug(f"🔍 Saved raw TTS audio for debugging: {saved_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save debug audio: {e}")
 
-        result = await self._tts_client.generate_audio_query(text, current_speaker_id, target_api_url)
-        return result  # type: ignore[return-value]
+    async def _generate_audio_query(self, text: str, speaker_id: int | None = None, engine_name: str | None = None) -> AudioQuery | None:
+        """Generate audio query from text using TTS client."""
+        target_engine, current_speaker_id, target_api_url = self._resolve_engine(speaker_id, engine_name)
+
+        key: CacheKey = (target_engine, current_speaker_id, self._text_digest(text))
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            # Callers tune the query in place, so hand out a private copy
+            return copy.deepcopy(cached)
+
+        result: AudioQuery | None = await self._tts_client.generate_audio_query(text, current_speaker_id, target_api_url)  # type: ignore[assignment]
+        if result:
+            self._cache_put(self._query_cache, key, copy.deepcopy(result))
+        return result
+
+    @staticmethod
+    def _text_digest(text: str) -> bytes:
+        """Hash text to a fixed-size cache key component."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_key(self, text: str, speaker_id: int | None, engine_name: str | None) -> CacheKey:
+        """Build the cache key for a synthesis request."""
+        target_engine, current_speaker_id, _ = self._resolve_engine(speaker_id, engine_name)
+        return (target_engine, current_speaker_id, self._text_digest(text))
+
+    def _resolve_engine(self, speaker_id: int | None, engine_name: str | None) -> tuple[str, int, str]:
+        """Resolve the (engine, speaker ID, API URL) a request should use.
+
+        Results are memoized until ``self.config`` is replaced.
+        """
+        if self._engine_cache_config is not self.config:
+            self._engine_cache.clear()
+            self._engine_cache_config = self.config
+
+        key = (engine_name, speaker_id)
+        resolved = self._engine_cache.get(key)
+        if resolved is None:
+            target_engine = engine_name or self.config.tts_engine
+            engines = self.config.engines
+            engine_config = engines.get(target_engine, engines["voicevox"])
+            # Use provided speaker ID or engine default
+            resolved = (target_engine, speaker_id or engine_config["default_speaker"], engine_config["url"])
+            self._engine_cache[key] = resolved
+        return resolved
+
+    @staticmethod
+    def _cache_put[V](cache: OrderedDict[CacheKey, V], key: CacheKey, value: V) -> None:
+        """Insert into an LRU cache, evicting the oldest entry when full."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > CACHE_MAXSIZE:
+            _ = cache.popitem(last=False)
+
+    def clear_caches(self) -> None:
+        """Drop all cached audio queries and audio data."""
+        self._query_cache.clear()
+        self._audio_cache.clear()
 
     async def _synthesize_from_query(self, audio_query: AudioQuery, speaker_id: int | None = None, engine_name: str | None = None) -> bytes | None:
         """Synthesize audio from audio query using TTS client."""
-        # Determine engine and speaker
-        target_engine = engine_name or self.config.tts_engine
-        engines = self.config.engines
-        engine_config = engines.get(target_engine, engines["voicevox"])
-
-        # Use provided speaker ID or engine default
-        current_speaker_id = speaker_id or engine_config["default_speaker"]
-        target_api_url = engine_config["url"]
-
+        _, current_speaker_id, target_api_url = self._resolve_engine(speaker_id, engine_name)
         return await self._tts_client.synthesize_from_query(audio_query, current_speaker_id, target_api_url)  # type: ignore[arg-type]
 
     async def create_audio_source(self, text: str, speaker_id: int | None = None, engine_name: str | None = None) -> Any:
@@ -204,53 +302,32 @@ class TTSEngine:
             WAV header as bytes
 
         """
-        import struct
-
-        # WAV file constants
-        bits_per_sample = 16  # 16-bit PCM
-        byte_rate = sample_rate * channels * (bits_per_sample // 8)
-        block_align = channels * (bits_per_sample // 8)
-
-        # WAV header structure
-        header = struct.pack(
-            "<4sL4s",  # RIFF header
-            b"RIFF",  # Chunk ID
-            36 + data_size,  # Chunk size
-            b"WAVE",
-        )  # Format
-
-        header += struct.pack(
-            "<4sLHHLLHH",  # fmt subchunk
-            b"fmt ",  # Subchunk1 ID
-            16,  # Subchunk1 size
-            1,  # Audio format (PCM)
-            channels,  # Number of channels
-            sample_rate,  # Sample rate
-            byte_rate,  # Byte rate
-            block_align,  # Block align
-            bits_per_sample,
-        )  # Bits per sample
-
-        header += struct.pack("<4sL", b"data", data_size)  # data subchunk header  # Subchunk2 ID  # Subchunk2 size
-
-        return header
+        return self._audio_processor.create_wav_header(data_size, sample_rate, channels)
 
     def cleanup_audio_source(self, audio_source: Any) -> None:
         """Clean up temporary files from audio source using temp file manager."""
         self._temp_file_manager.cleanup_audio_source(audio_source)
 
-    async def get_available_speakers(self) -> dict[str, int]:
+    def _load_speakers(self) -> None:
+        """Build the read-only speaker table for the current config."""
+        engine_config = self.config.engines.get(self.config.tts_engine, _NO_SPEAKERS)
+        self._speakers = MappingProxyType(engine_config.get("speakers", _NO_SPEAKERS))
+        self._speakers_config = self.config
+
+    def get_available_speakers(self) -> Mapping[str, int]:
         """Get available speakers for current engine.
 
         Returns:
-            Dictionary mapping speaker names to IDs
+            Read-only mapping of speaker names to IDs, built once per Config
 
         """
-        engine_config = self.config.engines.get(self.config.tts_engine, {})
-        return engine_config.get("speakers", {}).copy()
+        if self._speakers_config is not self.config:
+            self._load_speakers()
+        return self._speakers
 
     async def health_check(self) -> bool:
         """Perform health check on TTS engine using health monitor."""
+        await self._ensure_started()
         return await self._health_monitor.perform_health_check()
 
 
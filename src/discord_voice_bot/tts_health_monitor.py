@@ -1,12 +1,29 @@
 """Health monitoring for TTS engine."""
 
-from typing import Any
+import asyncio
+import time
+from typing import Any, NamedTuple
 
 from loguru import logger
 
 from .config import Config
 from .tts_client import TTSClient
 
+# How long a probe result is shared between health queries
+PROBE_TTL = 5.0  # seconds
+
+# Synthesized test audio below this size is treated as a failed synthesis
+MIN_TEST_AUDIO_SIZE = 100  # bytes
+
+
+class _ProbeResult(NamedTuple):
+    """Outcome of one API + synthesis probe against the TTS engine."""
+
+    api_available: bool
+    error_detail: str
+    test_audio_size: int
+    checked_at: float  # wall-clock time of the probe
+
 
 class TTSHealthMonitor:
     """Monitors the health of TTS engine components."""
@@ -15,74 +32,61 @@ class TTSHealthMonitor:
         """Initialize TTS health monitor with configuration and TTS client."""
         self.config = config
         self._tts_client = tts_client
+        self._probe_cache: tuple[float, _ProbeResult] | None = None
+        self._probe_lock = asyncio.Lock()
 
-    async def perform_health_check(self) -> bool:
-        """Perform comprehensive health check on TTS engine.
-
-        Returns:
-            True if TTS engine is healthy, False otherwise
+    async def _probe(self, ttl: float = PROBE_TTL) -> _ProbeResult:
+        """Probe API availability and synthesis, sharing results for ``ttl`` seconds.
 
+        Concurrent callers wait on the same probe instead of each hitting the backend.
         """
-        try:
-            # Check API availability
-            if not await self._check_api_health():
-                return False
-
-            # Test synthesis with a simple phrase
-            if not await self._test_synthesis():
-                return False
+        async with self._probe_lock:
+            now = time.monotonic()
+            if self._probe_cache is not None and now - self._probe_cache[0] < ttl:
+                return self._probe_cache[1]
 
-            logger.info("TTS health check passed")
-            return True
+            api_available, error_detail = await self._tts_client.check_api_availability()
+            test_audio_size = 0
+            # Synthesis can't succeed without the API, so don't spend a request on it
+            if api_available:
+                # Use a very simple test phrase to minimize resource usage
+                test_audio = await self._tts_client.synthesize_audio("test")
+                test_audio_size = len(test_audio) if test_audio else 0
 
-        except Exception as e:
-            logger.error(f"TTS health check failed: {e!s}")
-            return False
+            result = _ProbeResult(api_available, error_detail, test_audio_size, time.time())
+            self._probe_cache = (time.monotonic(), result)
+            return result
 
-    async def _check_api_health(self) -> bool:
-        """Check if TTS API is available and responding.
+    async def perform_health_check(self) -> bool:
+        """Perform comprehensive health check on TTS engine.
 
         Returns:
-            True if API is healthy, False otherwise
+            True if TTS engine is healthy, False otherwise
 
         """
         try:
-            is_available, error_detail = await self._tts_client.check_api_availability()
+            probe = await self._probe()
 
-            if not is_available:
-                logger.warning(f"TTS API health check failed: {error_detail}")
+            # Check API availability
+            if not probe.api_available:
+                logger.warning(f"TTS API health check failed: {probe.error_detail}")
                 return False
 
-            return True
-
-        except Exception as e:
-            logger.error(f"Error checking TTS API health: {e!s}")
-            return False
-
-    async def _test_synthesis(self) -> bool:
-        """Test actual audio synthesis to ensure TTS engine is working.
-
-        Returns:
-            True if synthesis test passes, False otherwise
-
-        """
-        try:
-            # Use a very simple test phrase to minimize resource usage
-            test_audio = await self._tts_client.synthesize_audio("test")
-
-            if not test_audio:
+            # Check the synthesized test phrase
+            if not probe.test_audio_size:
                 logger.warning("TTS health check failed: unable to synthesize test audio")
                 return False
 
             # Basic validation of the audio data
-            if len(test_audio) < 100:  # Very small minimum size
-                logger.warning(f"TTS health check failed: synthesized audio too small ({len(test_audio)} bytes)")
+            if probe.test_audio_size < MIN_TEST_AUDIO_SIZE:
+                logger.warning(f"TTS health check failed: synthesized audio too small ({probe.test_audio_size} bytes)")
                 return False
 
+            logger.info("TTS health check passed")
             return True
 
         except Exception as e:
-            logger.error(f"Error testing TTS synthesis: {e!s}")
+            logger.error(f"TTS health check failed: {e!s}")
             return False
 
     async def get_health_status(self) -> dict[str, Any]:
@@ -101,24 +105,24 @@ class TTSHealthMonitor:
         }
 
         try:
+            probe = await self._probe()
+
             # Check API availability
-            api_available, error_detail = await self._tts_client.check_api_availability()
-            health_status["api_available"] = api_available
+            health_status["api_available"] = probe.api_available
 
-            if not api_available:
-                health_status["issues"].append(f"API not available: {error_detail}")
+            if not probe.api_available:
+                health_status["issues"].append(f"API not available: {probe.error_detail}")
 
             # Test synthesis
-            test_audio = await self._tts_client.synthesize_audio("test")
-            synthesis_working = test_audio is not None and len(test_audio) > 100
+            synthesis_working = probe.test_audio_size > MIN_TEST_AUDIO_SIZE
             health_status["synthesis_working"] = synthesis_working
 
             if not synthesis_working:
                 health_status["issues"].append("Audio synthesis test failed")
 
             # Overall health
-            health_status["healthy"] = api_available and synthesis_working
-            health_status["last_check"] = __import__("time").time()
+            health_status["healthy"] = probe.api_available and synthesis_working
+            health_status["last_check"] = probe.checked_at
 
             if health_status["healthy"]:
                 logger.debug("TTS health status: ✅ Healthy")
@@ -142,18 +146,17 @@ class TTSHealthMonitor:
         issues: list[str] = []
 
         try:
-            # Check API availability
-            api_available, error_detail = await self._tts_client.check_api_availability()
+            probe = await self._probe()
 
-            if not api_available:
-                issues.append(f"🔴 API connectivity issue: {error_detail}")
+            # Check API availability
+            if not probe.api_available:
+                issues.append(f"🔴 API connectivity issue: {probe.error_detail}")
                 issues.append("   💡 Check if TTS engine (VOICEVOX/AivisSpeech) is running")
                 issues.append("   💡 Verify the API URL is correct")
                 issues.append("   💡 Check if the port is not blocked by firewall")
 
             # Test synthesis
-            test_audio = await self._tts_client.synthesize_audio("test")
-            if not test_audio:
+            if not probe.test_audio_size:
                 issues.append("🔴 Audio synthesis failed")
                 issues.append("   💡 Check TTS engine configuration")
                 issues.append("   💡 Verify speaker ID is valid")
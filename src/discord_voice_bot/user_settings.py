@@ -1,15 +1,47 @@
 """User-specific settings management for Discord Voice TTS Bot."""
 
+import asyncio
+import atexit
 import json
 import os
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from threading import RLock
+from threading import Lock
 from typing import Any
 
 from loguru import logger
 
 from .speaker_mapping import SPEAKER_MAPPING
 
+# Speaker mapping tables keyed by (from_engine, to_engine), resolved once at import
+_ENGINE_MAPPINGS: dict[tuple[str, str], dict[int, int]] = {
+    ("voicevox", "aivis"): SPEAKER_MAPPING["voicevox_to_aivis"],
+    ("aivis", "voicevox"): SPEAKER_MAPPING["aivis_to_voicevox"],
+}
+# Speaker IDs that identify a record as VOICEVOX when its engine is unknown
+_KNOWN_VOICEVOX_IDS = frozenset({1, 3, 5, 7})
+_DEFAULT_SPEAKERS: dict[str, int] = {
+    "voicevox": 3,  # Zundamon (Normal)
+    "aivis": 1512153250,  # Unofficial Zundamon (Normal)
+}
+
+# Seconds to coalesce settings mutations into a single file write
+SAVE_DEBOUNCE = 0.5
+
+# Encoder built once instead of per json.dumps call
+_ENCODE = json.JSONEncoder(ensure_ascii=False, indent=2, sort_keys=True).encode
+
+
+def _loads(data: bytes) -> Any:
+    """Parse the settings file's JSON bytes."""
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize settings to indented, key-sorted UTF-8 JSON bytes."""
+    return _ENCODE(data).encode("utf-8")
+
 
 class UserSettings:
     """Manages user-specific settings like voice preferences."""
@@ -31,7 +63,21 @@ class UserSettings:
         else:
             self.settings_file = Path(settings_file)
         self.settings: dict[str, dict[str, Any]] = {}
-        self._lock = RLock()
+        # Callers run on the loop thread; only executor/atexit file writes need a lock
+        self._write_lock = Lock()
+        # Signature of the file contents currently held in self.settings
+        self._loaded_signature: tuple[int, int] | None = None
+        # Debounced save state: unsaved per-user changes (None = removed),
+        # pending timer and in-flight write
+        self._pending: dict[str, dict[str, Any] | None] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_future: asyncio.Future[None] | None = None
+        self._save_seq = 0
+        self._written_seq = 0
+        # Secondary indexes over self.settings for the aggregate queries;
+        # engine buckets are insertion-ordered dicts used as ordered sets
+        self._by_engine: dict[str | None, dict[str, None]] = {}
+        self._by_speaker_name: Counter[str] = Counter()
 
         # Ensure directory exists
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
@@ -44,41 +90,126 @@ class UserSettings:
 
         logger.info(f"User settings initialized with {len(self.settings)} users")
 
+    def _file_signature(self) -> tuple[int, int] | None:
+        """Get the (mtime_ns, size) of the settings file, or None if it is missing."""
+        try:
+            st = self.settings_file.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _load_settings(self) -> None:
-        """Load settings from JSON file."""
-        with self._lock:
-            if self.settings_file.exists():
-                try:
-                    with open(self.settings_file, encoding="utf-8") as f:
-                        loaded_settings = json.load(f)
-                    # Only update if file has changed
-                    if loaded_settings != self.settings:
-                        self.settings = loaded_settings
-                        logger.debug(f"Reloaded settings for {len(self.settings)} users")
-                        # If any entries are missing 'engine', migrate in place
-                        if any("engine" not in v for v in self.settings.values()):
-                            self._migrate_settings()
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse settings file {self.settings_file}: {e}")
-                    # Don't clear existing settings on parse error
-                except Exception as e:
-                    logger.error(f"Failed to load settings from {self.settings_file}: {e}")
-                    # Don't clear existing settings on load error
+        """Load settings from JSON file if it changed since the last load or save.
+
+        Unsaved local changes are replayed on top of the file contents, so a
+        reload keeps them and a save keeps users written by other instances.
+        """
+        signature = self._file_signature()
+        if signature is not None and signature == self._loaded_signature:
+            return
+
+        if signature is not None:
+            try:
+                # One sized read of the whole file; json parses the bytes directly
+                loaded_settings = _loads(self.settings_file.read_bytes())
+                self._loaded_signature = signature
+                self._apply_pending(loaded_settings)
+                # Only update if file has changed
+                if loaded_settings != self.settings:
+                    self.settings = loaded_settings
+                    self._rebuild_indexes()
+                    logger.debug(f"Reloaded settings for {len(self.settings)} users")
+                    # If any entries are missing 'engine', migrate in place
+                    if any("engine" not in v for v in self.settings.values()):
+                        self._migrate_settings()
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse settings file {self.settings_file}: {e}")
+                # Don't clear existing settings on parse error
+            except Exception as e:
+                logger.error(f"Failed to load settings from {self.settings_file}: {e}")
+                # Don't clear existing settings on load error
+        else:
+            logger.debug(f"No existing settings file at {self.settings_file}, starting fresh")
+            self.settings = {}
+            self._loaded_signature = None
+            self._apply_pending(self.settings)
+            self._rebuild_indexes()
+
+    def _apply_pending(self, settings: dict[str, dict[str, Any]]) -> None:
+        """Replay unsaved local changes onto freshly loaded settings."""
+        for user_id, record in self._pending.items():
+            if record is None:
+                _ = settings.pop(user_id, None)
             else:
-                logger.debug(f"No existing settings file at {self.settings_file}, starting fresh")
-                self.settings = {}
+                settings[user_id] = record
 
     def _save_settings(self) -> None:
-        """Save settings to JSON file."""
+        """Save the pending changes to the JSON file.
+
+        Inside a running event loop the write is debounced: mutations within
+        SAVE_DEBOUNCE seconds are coalesced and the fsync'd write runs in the
+        default executor. Without a loop the file is written immediately.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(SAVE_DEBOUNCE, self._start_flush, loop)
+            # Don't lose a pending write if the process exits before the timer fires
+            _ = atexit.register(self.flush)
+
+    def _take_snapshot(self) -> tuple[int, bytes]:
+        """Merge in other writers' changes, then serialize and clear the pending set."""
+        self._load_settings()
+        self._pending.clear()
+        self._save_seq += 1
+        return self._save_seq, _dumps(self.settings)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hand the coalesced settings to the executor for writing."""
+        self._flush_handle = None
+        if self._flush_future is not None and not self._flush_future.done():
+            # Keep writes in order: wait for the in-flight write before starting another
+            self._flush_handle = loop.call_later(SAVE_DEBOUNCE, self._start_flush, loop)
+            return
+        if not self._pending:
+            atexit.unregister(self.flush)
+            return
+
+        # Serialize on the loop thread so the executor never sees a dict mid-mutation
+        seq, payload = self._take_snapshot()
+        self._flush_future = loop.run_in_executor(None, self._write_settings, seq, payload)
+        atexit.unregister(self.flush)
+
+    def flush(self) -> None:
+        """Write any pending settings to disk immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            atexit.unregister(self.flush)
+        if self._pending:
+            self._write_settings(*self._take_snapshot())
+
+    def _write_settings(self, seq: int, payload: bytes) -> None:
+        """Atomically replace the settings file with ``payload``."""
         tmp_path = None
-        with self._lock:
+        with self._write_lock:
+            # A newer snapshot may already be on disk (flush() racing the executor)
+            if seq <= self._written_seq:
+                return
             try:
                 tmp_path = self.settings_file.with_name(self.settings_file.name + ".tmp")
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    json.dump(self.settings, f, indent=2, ensure_ascii=False, sort_keys=True)
+                with open(tmp_path, "wb") as f:
+                    _ = f.write(payload)
                     f.flush()
                     os.fsync(f.fileno())
                 os.replace(tmp_path, self.settings_file)
+                self._written_seq = seq
+                # Our own write is already reflected in memory; don't re-parse it
+                self._loaded_signature = self._file_signature()
                 try:
                     dir_fd = os.open(self.settings_file.parent, os.O_RDONLY)
                     try:
@@ -112,18 +243,40 @@ class UserSettings:
                 # Determine engine based on speaker_id
                 speaker_id = user_data.get("speaker_id")
                 if speaker_id:
-                    # Check if it's a VOICEVOX speaker (typically small numbers)
-                    if speaker_id in [1, 3, 5, 7]:  # Known VOICEVOX IDs
-                        user_data["engine"] = "voicevox"
-                    else:
-                        user_data["engine"] = "aivis"
-
+                    user_data["engine"] = "voicevox" if speaker_id in _KNOWN_VOICEVOX_IDS else "aivis"
+                    self._pending[user_id] = user_data
                     migrated = True
                     logger.debug(f"Migrated user {user_id} settings: {user_data.get('speaker_name', 'Unknown')} -> engine: {user_data['engine']}")
         if migrated:
+            self._rebuild_indexes()
             self._save_settings()
             logger.info("Settings migration completed")
 
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the engine and speaker-name indexes from scratch."""
+        self._by_engine = {}
+        self._by_speaker_name = Counter()
+        for user_id, user_data in self.settings.items():
+            self._index_add(user_id, user_data)
+
+    def _index_add(self, user_id: str, user_data: dict[str, Any]) -> None:
+        """Add one user record to the indexes."""
+        self._by_engine.setdefault(user_data.get("engine"), {})[user_id] = None
+        self._by_speaker_name[user_data.get("speaker_name", "Unknown")] += 1
+
+    def _index_remove(self, user_id: str, user_data: dict[str, Any]) -> None:
+        """Remove one user record from the indexes."""
+        engine = user_data.get("engine")
+        bucket = self._by_engine.get(engine)
+        if bucket is not None:
+            _ = bucket.pop(user_id, None)
+            if not bucket:
+                del self._by_engine[engine]
+        speaker_name = user_data.get("speaker_name", "Unknown")
+        self._by_speaker_name[speaker_name] -= 1
+        if self._by_speaker_name[speaker_name] <= 0:
+            del self._by_speaker_name[speaker_name]
+
     def get_user_speaker(self, user_id: str, current_engine: str | None = None) -> int | None:
         """Get speaker ID for a specific user, mapping to current engine if needed.
 
@@ -135,7 +288,7 @@ class UserSettings:
             Speaker ID compatible with current engine, None if not set
 
         """
-        # Reload settings from file to get latest changes
+        # Pick up changes written by other instances (cheap when unchanged)
         self._load_settings()
 
         user_settings = self.settings.get(str(user_id))
@@ -174,20 +327,12 @@ class UserSettings:
         if from_engine == to_engine:
             return speaker_id
 
-        mapping_key = f"{from_engine}_to_{to_engine}"
-        mapping = SPEAKER_MAPPING.get(mapping_key, {})
-
-        mapped_id = mapping.get(speaker_id)
-        if mapped_id is not None:
-            return mapped_id
-
-        # No direct mapping found, use engine defaults
-        if to_engine == "voicevox":
-            return 3  # Zundamon (Normal)
-        elif to_engine == "aivis":
-            return 1512153250  # Unofficial Zundamon (Normal)
-
-        return speaker_id  # Fallback to original
+        # No direct mapping falls back to the target engine's default speaker
+        fallback = _DEFAULT_SPEAKERS.get(to_engine, speaker_id)
+        mapping = _ENGINE_MAPPINGS.get((from_engine, to_engine))
+        if mapping is None:
+            return fallback
+        return mapping.get(speaker_id, fallback)
 
     def set_user_speaker(self, user_id: str, speaker_id: int, speaker_name: str = "", engine: str | None = None) -> bool:
         """Set speaker preference for a user.
@@ -205,21 +350,21 @@ class UserSettings:
         try:
             user_id = str(user_id)
 
-            # Auto-detect engine if not specified
+            # Auto-detect engine if not specified: AIVIS IDs are large numbers,
+            # anything else falls back to voicevox for compatibility
             if engine is None:
-                if speaker_id in [1, 3, 5, 7]:  # Known VOICEVOX IDs
-                    engine = "voicevox"
-                elif speaker_id >= 100000:  # Typically AIVIS IDs are large numbers
-                    engine = "aivis"
-                else:
-                    # Engine will be determined by caller - fallback to voicevox for compatibility
-                    engine = "voicevox"  # Use voicevox as fallback
+                engine = "aivis" if speaker_id not in _KNOWN_VOICEVOX_IDS and speaker_id >= 100000 else "voicevox"
 
+            previous = self.settings.get(user_id)
+            if previous is not None:
+                self._index_remove(user_id, previous)
             self.settings[user_id] = {
                 "speaker_id": speaker_id,
                 "speaker_name": speaker_name,
                 "engine": engine,
             }
+            self._index_add(user_id, self.settings[user_id])
+            self._pending[user_id] = self.settings[user_id]
             self._save_settings()
             logger.info(f"Set speaker for user {user_id}: {speaker_name} ({speaker_id}) on {engine} engine")
             return True
@@ -239,7 +384,8 @@ class UserSettings:
         """
         user_id = str(user_id)
         if user_id in self.settings:
-            del self.settings[user_id]
+            self._index_remove(user_id, self.settings.pop(user_id))
+            self._pending[user_id] = None
             self._save_settings()
             logger.info(f"Removed speaker preference for user {user_id}")
             return True
@@ -257,7 +403,9 @@ class UserSettings:
         """
         # Reload to get latest settings
         self._load_settings()
-        return self.settings.get(str(user_id))
+        user_settings = self.settings.get(str(user_id))
+        # Records are flat dicts of scalars, so a shallow copy fully detaches them
+        return dict(user_settings) if user_settings is not None else None
 
     def list_all_settings(self) -> dict[str, dict[str, Any]]:
         """Get all user settings.
@@ -268,7 +416,8 @@ class UserSettings:
         """
         # Reload to get latest settings
         self._load_settings()
-        return self.settings.copy()
+        # Copy each flat record so callers can't mutate the cached settings
+        return {user_id: dict(user_data) for user_id, user_data in self.settings.items()}
 
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about user settings.
@@ -277,20 +426,15 @@ class UserSettings:
             Statistics dictionary
 
         """
-        speaker_counts: dict[str, int] = {}
-        engine_counts: dict[str, int] = {}
-
-        for user_data in self.settings.values():
-            speaker_name = user_data.get("speaker_name", "Unknown")
-            engine = user_data.get("engine", "unknown")
-
-            speaker_counts[speaker_name] = speaker_counts.get(speaker_name, 0) + 1
-            engine_counts[engine] = engine_counts.get(engine, 0) + 1
+        self._load_settings()
+        engine_counts: Counter[str] = Counter()
+        for engine, user_ids in self._by_engine.items():
+            engine_counts["unknown" if engine is None else engine] += len(user_ids)
 
         return {
             "total_users": len(self.settings),
-            "speaker_distribution": speaker_counts,
-            "engine_distribution": engine_counts,
+            "speaker_distribution": dict(self._by_speaker_name),
+            "engine_distribution": dict(engine_counts),
         }
 
     def get_engine_compatibility_info(self, current_engine: str) -> dict[str, Any]:
@@ -303,36 +447,42 @@ class UserSettings:
             Dictionary with compatibility information
 
         """
+        self._load_settings()
         compatible_users: list[dict[str, Any]] = []
         mapped_users: list[dict[str, Any]] = []
 
-        for user_id, user_data in self.settings.items():
-            user_engine = user_data.get("engine", "voicevox")
-            speaker_id = user_data.get("speaker_id")
-            speaker_name = user_data.get("speaker_name", "Unknown")
+        for engine, user_ids in self._by_engine.items():
+            # Records without an engine predate multi-engine support and are VOICEVOX
+            user_engine = "voicevox" if engine is None else engine
 
             if user_engine == current_engine:
-                compatible_users.append(
-                    {
-                        "user_id": user_id,
-                        "speaker_id": speaker_id,
-                        "speaker_name": speaker_name,
-                        "engine": user_engine,
-                    }
-                )
-            else:
-                if speaker_id is not None:
-                    mapped_id = self._map_speaker_to_engine(speaker_id, user_engine, current_engine)
-                    mapped_users.append(
+                for user_id in user_ids:
+                    user_data = self.settings[user_id]
+                    compatible_users.append(
                         {
                             "user_id": user_id,
-                            "original_speaker_id": speaker_id,
-                            "mapped_speaker_id": mapped_id,
-                            "speaker_name": speaker_name,
-                            "original_engine": user_engine,
-                            "current_engine": current_engine,
+                            "speaker_id": user_data.get("speaker_id"),
+                            "speaker_name": user_data.get("speaker_name", "Unknown"),
+                            "engine": user_engine,
                         }
                     )
+                continue
+
+            for user_id in user_ids:
+                user_data = self.settings[user_id]
+                speaker_id = user_data.get("speaker_id")
+                if speaker_id is None:
+                    continue
+                mapped_users.append(
+                    {
+                        "user_id": user_id,
+                        "original_speaker_id": speaker_id,
+                        "mapped_speaker_id": self._map_speaker_to_engine(speaker_id, user_engine, current_engine),
+                        "speaker_name": user_data.get("speaker_name", "Unknown"),
+                        "original_engine": user_engine,
+                        "current_engine": current_engine,
+                    }
+                )
 
         return {
             "current_engine": current_engine,
@@ -343,6 +493,7 @@ class UserSettings:
         }
 
 
+@lru_cache(maxsize=1)
 def load_user_settings() -> UserSettings:
-    """Create new user settings instance."""
+    """Get the user settings instance shared by commands and the synthesizer."""
     return UserSettings()
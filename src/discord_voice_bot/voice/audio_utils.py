@@ -1,78 +1,110 @@
 """Audio utility functions for voice operations."""
 
+import asyncio
+import io
 import os
+import struct
 import tempfile
+from collections.abc import Buffer
 from typing import Any
 
 from loguru import logger
 
+# RIFF/WAVE tags plus the channel count, sample rate and bit depth from the
+# canonical 44-byte WAV header, skipping the fields validation doesn't need
+_WAV_HEADER_FIELDS = struct.Struct("<4s4x4s10xHI6xH")
 
-def validate_wav_format(audio_data: bytes) -> bool:
-    """Validate audio data format and basic properties."""
-    try:
-        if len(audio_data) < 44:  # WAV header is at least 44 bytes
-            return False
-
-        # Check WAV header
-        if audio_data[:4] != b"RIFF" or audio_data[8:12] != b"WAVE":
-            return False
-
-        # Extract basic format info
-        channels = int.from_bytes(audio_data[22:24], byteorder="little")
-        sample_rate = int.from_bytes(audio_data[24:28], byteorder="little")
-        bits_per_sample = int.from_bytes(audio_data[34:36], byteorder="little")
-
-        # Validate reasonable audio parameters
-        if channels not in [1, 2]:
-            return False
-        if sample_rate not in [8000, 16000, 22050, 44100, 48000]:
-            return False
-        if bits_per_sample not in [8, 16, 24, 32]:
-            return False
-
-        return True
-
-    except Exception as e:
-        logger.error(f"Audio format validation error: {e}")
+# Audio parameters accepted by validate_wav_format
+_VALID_CHANNELS = frozenset((1, 2))
+_VALID_SAMPLE_RATES = frozenset((8000, 16000, 22050, 44100, 48000))
+_VALID_BITS_PER_SAMPLE = frozenset((8, 16, 24, 32))
+
+
+def validate_wav_format(audio_data: Buffer) -> bool:
+    """Validate audio data format and basic properties.
+
+    Accepts any buffer (bytes, bytearray, memoryview); the header is parsed
+    in place without copying the audio.
+    """
+    # With the length gate in place the fixed-size unpack cannot fail
+    if get_audio_size(audio_data) < 44:  # WAV header is at least 44 bytes
         return False
 
+    riff, wave, channels, sample_rate, bits_per_sample = _WAV_HEADER_FIELDS.unpack_from(audio_data)
+
+    # Check WAV header
+    if riff != b"RIFF" or wave != b"WAVE":
+        return False
+
+    # Validate reasonable audio parameters
+    return channels in _VALID_CHANNELS and sample_rate in _VALID_SAMPLE_RATES and bits_per_sample in _VALID_BITS_PER_SAMPLE
+
 
 def cleanup_file(audio_path: str) -> None:
     """Clean up temporary audio file."""
+    if not audio_path:
+        return
     try:
-        if audio_path and os.path.exists(audio_path):
-            os.remove(audio_path)
-    except Exception as e:
+        os.unlink(audio_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
         logger.warning(f"Failed to cleanup audio file: {e}")
 
 
+async def cleanup_file_async(audio_path: str) -> None:
+    """Clean up temporary audio file without blocking the event loop."""
+    await asyncio.to_thread(cleanup_file, audio_path)
+
+
 def calculate_message_priority(item: dict[str, Any]) -> int:
     """Calculate priority for message processing."""
+    text = item.get("text", "")
+    length = len(text)
     priority = 5  # Default priority
 
     # Higher priority for shorter messages (quicker processing)
-    if len(item.get("text", "")) < 50:
+    if length < 50:
         priority -= 1
 
     # Higher priority for commands
-    if item.get("text", "").startswith("!"):
+    if text[:1] == "!":
         priority -= 2
 
     # Lower priority for very long messages
-    if len(item.get("text", "")) > 200:
+    if length > 200:
         priority += 2
 
     return max(1, min(10, priority))  # Clamp between 1-10
 
 
-async def create_temp_audio_file(audio_data: bytes, suffix: str = ".wav") -> str:
-    """Create a temporary audio file with the given data."""
+def audio_bytes_stream(audio_data: bytes) -> io.BytesIO:
+    """Wrap audio data in a stream that can be piped to FFmpeg."""
+    return io.BytesIO(audio_data)
+
+
+def _write_temp_audio_file(audio_data: bytes, suffix: str) -> str:
+    """Write audio data to a new temporary file and return its path."""
     with tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as f:
-        result = f.write(audio_data)
-        _ = result  # Handle unused result
+        _ = f.write(audio_data)
         return f.name
 
 
-def get_audio_size(audio_data: bytes) -> int:
+async def create_temp_audio_file(audio_data: bytes, suffix: str = ".wav") -> str:
+    """Create a temporary audio file with the given data.
+
+    Playback streams audio from memory (see audio_bytes_stream); this is the
+    fallback for consumers that need a file path. The write runs in the
+    default executor so large clips don't stall the event loop (and with it
+    the Discord heartbeat).
+    """
+    return await asyncio.to_thread(_write_temp_audio_file, audio_data, suffix)
+
+
+def get_audio_size(audio_data: Buffer) -> int:
     """Get the size of audio data in bytes."""
-    return len(audio_data)
+    if isinstance(audio_data, bytes | bytearray):
+        return len(audio_data)
+    # len() of a memoryview counts items, not bytes, for non-byte formats
+    with memoryview(audio_data) as view:
+        return view.nbytes
@@ -1,47 +1,97 @@
 """Voice connection management for voice handler."""
 
 import asyncio
+import random
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import discord
 from loguru import logger
 
 from ..protocols import ConfigManager
+from .gateway import VoiceGatewayManager
+from .rate_limiter_manager import RateLimiterManager
+
+# Gateway events forwarded to VoiceGatewayManager, by handler method name so the
+# table stays valid when voice_gateway is replaced
+_GATEWAY_HANDLERS: dict[str, str] = {
+    "VOICE_SERVER_UPDATE": "handle_voice_server_update",
+    "VOICE_STATE_UPDATE": "handle_voice_state_update",
+}
+
+# Backoff waits shorter than this (in seconds) are treated as already elapsed
+MIN_BACKOFF_WAIT = 0.001
+
+# Longest wait (in seconds) for our own voice state after joining a stage channel
+STAGE_VOICE_STATE_TIMEOUT = 1.0
 
 
 class VoiceConnectionManager:
     """Manages Discord voice connections and related functionality."""
 
-    def __init__(self, bot_client: discord.Client, config_manager: ConfigManager) -> None:
+    __slots__ = (
+        "_backoff_base",
+        "_backoff_cap",
+        "_config_manager",
+        "_consecutive_failures",
+        "_last_connection_attempt",
+        "_loop",
+        "_next_allowed_attempt",
+        "_rate_limiter",
+        "bot",
+        "connection_state",
+        "target_channel",
+        "voice_client",
+        "voice_gateway",
+    )
+
+    def __init__(self, bot_client: discord.Client, config_manager: ConfigManager, rate_limiter: RateLimiterManager | None = None) -> None:
         """Initialize voice connection manager."""
         super().__init__()
         self.bot = bot_client
         self._config_manager = config_manager
+        # Shared with the handler so REST calls made while connecting count
+        # against the same limiter and circuit breaker
+        self._rate_limiter = rate_limiter or RateLimiterManager()
         self.voice_client: discord.VoiceClient | None = None
-        self.voice_gateway = None
         self.target_channel: discord.VoiceChannel | discord.StageChannel | None = None
         self.connection_state = "DISCONNECTED"
         self._last_connection_attempt = 0.0
-        self._reconnection_cooldown = 5  # seconds
-
-        # Initialize voice gateway for backward compatibility
-        from .gateway import VoiceGatewayManager
-
-        # Initialize with None for now, will be set when voice client is available
-        self.voice_gateway = VoiceGatewayManager(None)  # type: ignore[arg-type]
+        self._next_allowed_attempt = 0.0  # loop.time() before which connects wait
+        # Capped exponential backoff between attempts, with jitter so restarted
+        # bots don't retry in lockstep
+        self._consecutive_failures = 0
+        self._backoff_base = 1.0  # seconds
+        self._backoff_cap = 60.0  # seconds
+        # Event loop the manager runs on, captured on first connection attempt
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Initialize voice gateway for backward compatibility; the real voice
+        # client is attached once a connection is established
+        self.voice_gateway: VoiceGatewayManager | None = VoiceGatewayManager(None)  # type: ignore[arg-type]
 
     async def connect_to_channel(self, channel_id: int) -> bool:
+        """Connect to a voice channel, backing off after consecutive failures."""
+        # Wait out the backoff window set by the previous attempt
+        loop = self._loop or asyncio.get_running_loop()
+        self._loop = loop
+        now = loop.time()
+        # Sub-millisecond remainders aren't worth a timer registration
+        if now + MIN_BACKOFF_WAIT < self._next_allowed_attempt:
+            wait_time = self._next_allowed_attempt - now
+            logger.debug("Waiting {:.1f}s before reconnecting ({} consecutive failures)", wait_time, self._consecutive_failures)
+            await asyncio.sleep(wait_time)
+
+        self._last_connection_attempt = now
+        connected = await self._connect(channel_id)
+        self._consecutive_failures = 0 if connected else self._consecutive_failures + 1
+        # Spacing is measured from the start of this attempt
+        self._next_allowed_attempt = now + self.reconnection_cooldown + random.random()
+        return connected
+
+    async def _connect(self, channel_id: int) -> bool:
         """Connect to a voice channel with comprehensive error handling."""
         try:
-            # Check reconnection cooldown
-            now = asyncio.get_event_loop().time()
-            time_since_last_attempt = now - self._last_connection_attempt
-            if time_since_last_attempt < self._reconnection_cooldown:
-                wait_time = self._reconnection_cooldown - time_since_last_attempt
-                logger.debug(".1f")
-                await asyncio.sleep(wait_time)
-
-            self._last_connection_attempt = now
             logger.info(f"🔄 ATTEMPTING VOICE CONNECTION - Channel ID: {channel_id}")
 
             # Get channel information
@@ -54,39 +104,35 @@ class VoiceConnectionManager:
                 logger.error(f"❌ INVALID CHANNEL TYPE - Channel {channel_id} is not a voice channel")
                 return False
 
-            logger.info(f"📍 TARGET CHANNEL INFO - Name: {channel.name}, Type: {type(channel).__name__}, Guild: {channel.guild.name}")
-
-            # Check current connection status
-            if self.is_connected():
-                current_channel_id = getattr(self.voice_client.channel, "id", None) if self.voice_client else None
+            channel_name = channel.name
+            logger.info(f"📍 TARGET CHANNEL INFO - Name: {channel_name}, Type: {type(channel).__name__}, Guild: {channel.guild.name}")
 
-                if current_channel_id == channel_id:
-                    logger.info(f"✅ ALREADY CONNECTED - Already connected to target channel {channel.name}")
+            # Check current connection status once, against a snapshot of the client
+            vc = self.voice_client
+            if vc is not None and vc.is_connected():
+                current_channel = vc.channel
+                if current_channel.id == channel_id:
+                    logger.info(f"✅ ALREADY CONNECTED - Already connected to target channel {channel_name}")
                     return True
                 else:
-                    if self.voice_client and self.voice_client.channel:
-                        logger.info(f"🔄 MOVING CHANNELS - From {self.voice_client.channel.name} to {channel.name}")
+                    logger.info(f"🔄 MOVING CHANNELS - From {current_channel.name} to {channel_name}")
                     try:
-                        if self.voice_client:
-                            await self.voice_client.move_to(channel)
-                            logger.info(f"✅ SUCCESSFULLY MOVED - Now connected to voice channel: {channel.name}")
-                            return True
+                        await vc.move_to(channel)
+                        logger.info(f"✅ SUCCESSFULLY MOVED - Now connected to voice channel: {channel_name}")
+                        return True
                     except Exception as move_error:
-                        logger.error(f"❌ MOVE FAILED - Error moving to channel {channel.name}: {move_error}")
-                        if self.voice_client:
-                            await self.voice_client.disconnect()
-                            self.voice_client = None
+                        logger.error(f"❌ MOVE FAILED - Error moving to channel {channel_name}: {move_error}")
+                        await vc.disconnect()
+                        self.voice_client = None
 
             # Fresh connection attempt
-            logger.info(f"🔗 ESTABLISHING NEW CONNECTION - Connecting to {channel.name}")
-            self.voice_client = await channel.connect()
-            logger.info(f"✅ CONNECTION SUCCESSFUL - Connected to voice channel: {channel.name}")
+            logger.info(f"🔗 ESTABLISHING NEW CONNECTION - Connecting to {channel_name}")
+            vc = self.voice_client = await channel.connect()
+            logger.info(f"✅ CONNECTION SUCCESSFUL - Connected to voice channel: {channel_name}")
 
             # Initialize voice gateway manager
-            if self.voice_client:
-                from .gateway import VoiceGatewayManager
-
-                self.voice_gateway = VoiceGatewayManager(self.voice_client)
+            if vc:
+                self.voice_gateway = VoiceGatewayManager(vc)
                 logger.info("🎯 Voice Gateway Manager initialized")
 
             # Verify connection
@@ -97,10 +143,23 @@ class VoiceConnectionManager:
 
             # Handle stage channel specifics
             if isinstance(channel, discord.StageChannel):
-                await asyncio.sleep(1)
-                if channel.guild.me and channel.guild.me.voice and channel.guild.me.voice.suppress:
+                me = channel.guild.me
+                if me and me.voice is None:
+                    # connect() normally returns after our voice state has arrived;
+                    # if it hasn't yet, wait for it rather than sleeping a fixed time
+                    member_id = me.id
+
+                    def is_own_state(member: discord.Member, _before: discord.VoiceState, _after: discord.VoiceState) -> bool:
+                        return member.id == member_id
+
                     try:
-                        _ = await channel.guild.me.edit(suppress=False)
+                        _ = await self.bot.wait_for("voice_state_update", check=is_own_state, timeout=STAGE_VOICE_STATE_TIMEOUT)
+                    except TimeoutError:
+                        logger.debug("Voice state for stage channel not received in time")
+                    me = channel.guild.me
+                if me and me.voice and me.voice.suppress:
+                    try:
+                        _ = await self._rate_limiter.make_rate_limited_request(me.edit, suppress=False)
                         logger.info("🎤 STAGE CHANNEL - Successfully requested to speak")
                     except Exception as stage_error:
                         logger.warning(f"⚠️ STAGE CHANNEL - Failed to request speaking: {stage_error}")
@@ -114,35 +173,40 @@ class VoiceConnectionManager:
 
     async def handle_voice_server_update(self, payload: dict[str, Any]) -> None:
         """Handle VOICE_SERVER_UPDATE event."""
-        if self.voice_gateway:
-            await self.voice_gateway.handle_voice_server_update(payload)
-        else:
-            logger.warning("⚠️ Voice gateway manager not initialized, cannot handle voice server update")
+        await self._dispatch_to_gateway("VOICE_SERVER_UPDATE", payload)
 
     async def handle_voice_state_update(self, payload: dict[str, Any]) -> None:
         """Handle VOICE_STATE_UPDATE event."""
-        if self.voice_gateway:
-            await self.voice_gateway.handle_voice_state_update(payload)
-        else:
-            logger.warning("⚠️ Voice gateway manager not initialized, cannot handle voice state update")
+        await self._dispatch_to_gateway("VOICE_STATE_UPDATE", payload)
+
+    async def _dispatch_to_gateway(self, event: str, payload: dict[str, Any]) -> None:
+        """Forward a voice gateway event to the current gateway manager."""
+        gateway = self.voice_gateway
+        if gateway is None:
+            logger.warning(f"⚠️ Voice gateway manager not initialized, cannot handle {event}")
+            return
+        handler: Callable[[dict[str, Any]], Awaitable[None]] = getattr(gateway, _GATEWAY_HANDLERS[event])
+        await handler(payload)
 
     def is_connected(self) -> bool:
         """Check if the bot is connected to a voice channel."""
+        vc = self.voice_client
         try:
-            return self.voice_client is not None and self.voice_client.is_connected()
-        except Exception:
+            return vc is not None and vc.is_connected()
+        except AttributeError:  # Client torn down mid-check
             return False
 
     async def cleanup_voice_client(self) -> None:
         """Aggressively clean up voice client state."""
-        if not self.voice_client:
+        vc = self.voice_client
+        if not vc:
             return
 
         logger.debug("🧹 Cleaning up voice client...")
 
         try:
-            if hasattr(self.voice_client, "is_connected") and self.voice_client.is_connected():
-                await self.voice_client.disconnect()
+            if hasattr(vc, "is_connected") and vc.is_connected():
+                await vc.disconnect()
                 logger.debug("✅ Voice client disconnected gracefully")
             else:
                 logger.debug("ℹ️ Voice client was already disconnected")
@@ -159,18 +223,20 @@ class VoiceConnectionManager:
 
     def get_connection_info(self) -> dict[str, Any]:
         """Get current connection information."""
-        connected = bool(self.voice_client and self.voice_client.is_connected())
+        vc = self.voice_client
+        connected = bool(vc and vc.is_connected())
+        channel = getattr(vc, "channel", None) if vc else None
         channel_name = None
         channel_id = None
 
         try:
-            if self.voice_client and getattr(self.voice_client, "channel", None):
-                channel_name = self.voice_client.channel.name
-                channel_id = self.voice_client.channel.id
+            if channel:
+                channel_name = channel.name
+                channel_id = channel.id
             elif self.target_channel:
                 channel_name = self.target_channel.name
                 channel_id = self.target_channel.id
-        except Exception:
+        except AttributeError:
             pass
 
         return {"connected": connected, "channel_name": channel_name, "channel_id": channel_id, "connection_state": self.connection_state}
@@ -181,6 +247,7 @@ class VoiceConnectionManager:
         return self._last_connection_attempt
 
     @property
-    def reconnection_cooldown(self) -> int:
-        """Get the reconnection cooldown duration in seconds."""
-        return self._reconnection_cooldown
+    def reconnection_cooldown(self) -> float:
+        """Get the current reconnection backoff in seconds, excluding jitter."""
+        # Cap the exponent too so a long outage can't overflow the float math
+        return min(self._backoff_cap, self._backoff_base * 2 ** min(self._consecutive_failures, 16))
@@ -9,6 +9,8 @@ from loguru import logger
 class VoiceGatewayManager:
     """Manages voice gateway connections following Discord's official steps."""
 
+    __slots__ = ("_connected", "_endpoint", "_guild_id", "_session_id", "_token", "voice_client")
+
     def __init__(self, voice_client: discord.VoiceClient):
         super().__init__()
         self.voice_client = voice_client
@@ -26,8 +28,9 @@ class VoiceGatewayManager:
             self._endpoint = payload.get("endpoint")
 
             # Remove protocol if present and add voice gateway version
-            if self._endpoint and "://" in self._endpoint:
-                self._endpoint = self._endpoint.split("://")[1]
+            if self._endpoint:
+                head, sep, tail = self._endpoint.partition("://")
+                self._endpoint = tail if sep else head
 
             logger.info(f"📡 Voice server update received - Guild: {self._guild_id}, Endpoint: {self._endpoint}")
 
@@ -44,7 +47,8 @@ class VoiceGatewayManager:
             logger.info(f"🎤 Voice state update - Session ID: {self._session_id}")
 
             # Voice client handles the connection, but we track state for compliance
-            if self._session_id and self.voice_client.is_connected():
+            vc = self.voice_client
+            if self._session_id and vc.is_connected():
                 self._connected = True
                 logger.info("✅ Voice gateway connection established with proper session")
 
@@ -62,10 +66,11 @@ class VoiceGatewayManager:
                 logger.info("✅ Voice client connected with Discord API compliance")
                 self._connected = True
 
-                # Log connection details for transparency
+                # Log connection details for transparency; lazy so the attribute
+                # walk is skipped when debug logging is off
                 if hasattr(self.voice_client, "channel") and self.voice_client.channel:
-                    logger.debug(f"🎵 Connected to voice channel: {self.voice_client.channel.name}")
-                    logger.debug(f"🔊 Voice client SSRC: {getattr(self.voice_client, 'ssrc', 'Unknown')}")
+                    vc = self.voice_client
+                    logger.opt(lazy=True).debug("🎵 Connected to voice channel: {} (SSRC: {})", lambda: vc.channel.name, lambda: getattr(vc, "ssrc", "Unknown"))
             else:
                 logger.warning("⚠️ Voice client not yet connected, waiting for handshake completion")
 
@@ -74,13 +79,14 @@ class VoiceGatewayManager:
 
     def get_connection_info(self) -> dict[str, Any]:
         """Get voice connection information for debugging."""
+        vc = self.voice_client
         return {
             "connected": self._connected,
             "session_id": self._session_id,
             "guild_id": self._guild_id,
             "has_token": self._token is not None,
             "endpoint": self._endpoint,
-            "client_connected": self.voice_client.is_connected() if self.voice_client else False,
+            "client_connected": vc.is_connected() if vc else False,
         }
 
     def is_connected(self) -> bool:
@@ -1,6 +1,8 @@
 """Voice handler facade for Discord Voice TTS Bot."""
 
 import asyncio
+from collections.abc import Coroutine
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol
 
 import discord
@@ -10,6 +12,8 @@ from ..config import Config
 
 if TYPE_CHECKING:
     from .gateway import VoiceGatewayManager
+    from .workers.player import PlayerWorker
+    from .workers.synthesizer import SynthesizerWorker
 
 # Import new manager classes
 from .connection_manager import VoiceConnectionManager
@@ -19,9 +23,29 @@ from .rate_limiter_manager import RateLimiterManager
 from .stats_tracker import StatsTracker
 from .task_manager import TaskManager
 
-# Import worker classes for type hints and instance management
-from .workers.player import PlayerWorker
-from .workers.synthesizer import SynthesizerWorker
+
+@lru_cache(maxsize=1)
+def _ensure_opus() -> bool:
+    """Load the Opus library if needed, once per process, and report whether it is available."""
+    try:
+        logger.debug("🔊 Checking Opus library availability...")
+        import discord.opus as opus
+
+        if not opus.is_loaded():
+            logger.debug("🔊 Opus library not loaded, attempting to load 'opus'...")
+            try:
+                opus.load_opus("opus")
+                logger.debug("✅ Opus library loaded successfully via 'opus'")
+            except Exception as e:
+                logger.debug(f"❌ Failed to load Opus via 'opus': {e}")
+        else:
+            logger.debug("✅ Opus library already loaded")
+
+        return opus.is_loaded()
+    except Exception as e:
+        logger.debug(f"❌ Error checking Opus library: {e}")
+        # Best-effort only
+        return True
 
 
 class VoiceHandlerInterface(Protocol):
@@ -33,11 +57,15 @@ class VoiceHandlerInterface(Protocol):
     voice_client: Any
     target_channel: Any
     current_group_id: str | None
-    is_playing: bool
     stats: "StatsTracker"
     connection_state: str
     synthesizer: "SynthesizerWorker | None"
 
+    @property
+    def is_playing(self) -> bool:
+        """Whether the voice client is currently playing audio."""
+        ...
+
     async def start(self) -> None:
         """Start the voice handler tasks."""
         ...
@@ -46,23 +74,23 @@ class VoiceHandlerInterface(Protocol):
         """Check if the bot is connected to a voice channel."""
         ...
 
-    async def connect_to_channel(self, channel_id: int) -> bool:
+    def connect_to_channel(self, channel_id: int) -> Coroutine[Any, Any, bool]:
         """Connect to a voice channel."""
         ...
 
-    async def handle_voice_server_update(self, payload: dict[str, Any]) -> None:
+    def handle_voice_server_update(self, payload: dict[str, Any]) -> Coroutine[Any, Any, None]:
         """Handle VOICE_SERVER_UPDATE event."""
         ...
 
-    async def handle_voice_state_update(self, payload: dict[str, Any]) -> None:
+    def handle_voice_state_update(self, payload: dict[str, Any]) -> Coroutine[Any, Any, None]:
         """Handle VOICE_STATE_UPDATE event."""
         ...
 
-    async def make_rate_limited_request(self, api_call: Any, *args: Any, **kwargs: Any) -> Any:
+    def make_rate_limited_request(self, api_call: Any, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, Any]:
         """Make a rate-limited API request."""
         ...
 
-    async def add_to_queue(self, message_data: dict[str, Any]) -> None:
+    def add_to_queue(self, message_data: dict[str, Any]) -> Coroutine[Any, Any, None]:
         """Add message to synthesis queue."""
         ...
 
@@ -78,7 +106,7 @@ class VoiceHandlerInterface(Protocol):
         """Get current status information."""
         ...
 
-    async def health_check(self) -> dict[str, Any]:
+    def health_check(self) -> Coroutine[Any, Any, dict[str, Any]]:
         """Perform voice connection health check."""
         ...
 
@@ -86,7 +114,7 @@ class VoiceHandlerInterface(Protocol):
         """Clean up resources."""
         ...
 
-    async def cleanup_voice_client(self) -> None:
+    def cleanup_voice_client(self) -> Coroutine[Any, Any, None]:
         """Clean up voice client state."""
         ...
 
@@ -101,16 +129,13 @@ class VoiceHandler(VoiceHandlerInterface):
         self.config = config
 
         # Initialize manager components
-        self.connection_manager = VoiceConnectionManager(bot_client, config)
-        self.queue_manager = QueueManager()
         self.rate_limiter_manager = RateLimiterManager()
+        self.connection_manager = VoiceConnectionManager(bot_client, config, self.rate_limiter_manager)
+        self.queue_manager = QueueManager()
         self.stats_tracker = StatsTracker()
         self.task_manager = TaskManager()
         self.health_monitor = HealthMonitor(self.connection_manager, config)
 
-        # Maintain backward compatibility properties
-        self.is_playing = False
-
         # Delegate properties to managers for backward compatibility
         self.voice_client = self.connection_manager.voice_client
         self.target_channel = self.connection_manager.target_channel
@@ -132,10 +157,19 @@ class VoiceHandler(VoiceHandlerInterface):
         self.tasks = self.task_manager.tasks
 
         # Worker instances for graceful shutdown
-        self._synthesizer_worker: SynthesizerWorker | None = None
-        self._player_worker: PlayerWorker | None = None
+        self._synthesizer_worker: "SynthesizerWorker | None" = None
+        self._player_worker: "PlayerWorker | None" = None
+        self._supervisor: asyncio.Task[None] | None = None
 
-    synthesizer: SynthesizerWorker | None = None
+    synthesizer: "SynthesizerWorker | None" = None
+
+    @property
+    def is_playing(self) -> bool:  # type: ignore[override]
+        """Whether the voice client is currently playing audio."""
+        # The connection manager owns the live client; self.voice_client is only
+        # the snapshot taken at construction
+        vc = self.connection_manager.voice_client
+        return bool(vc and vc.is_playing())
 
     @property
     def voice_gateway(self):
@@ -150,27 +184,8 @@ class VoiceHandler(VoiceHandlerInterface):
     async def start(self, start_player: bool = True) -> None:  # type: ignore[override]
         """Start the voice handler tasks."""
         # Diagnostics: ensure opus is loaded; if not, voice playback will fail
-        try:
-            logger.debug("🔊 Checking Opus library availability...")
-            import discord.opus as opus
-
-            if not opus.is_loaded():
-                logger.debug("🔊 Opus library not loaded, attempting to load 'opus'...")
-                try:
-                    opus.load_opus("opus")
-                    logger.debug("✅ Opus library loaded successfully via 'opus'")
-                except Exception as e:
-                    logger.debug(f"❌ Failed to load Opus via 'opus': {e}")
-            else:
-                logger.debug("✅ Opus library already loaded")
-
-            if not opus.is_loaded():
-                logger.warning("Opus library is not loaded. Audio playback may fail. Install system libopus or ensure discord.py[voice] is correctly installed.")
-            else:
-                logger.debug("✅ Opus library is available for audio playback")
-        except Exception as e:
-            logger.debug(f"❌ Error checking Opus library: {e}")
-            # Best-effort only
+        if not _ensure_opus():
+            logger.warning("Opus library is not loaded. Audio playback may fail. Install system libopus or ensure discord.py[voice] is correctly installed.")
 
         # Start worker tasks
         await self._start_workers(start_player)
@@ -179,6 +194,16 @@ class VoiceHandler(VoiceHandlerInterface):
 
     async def _start_workers(self, start_player: bool = True) -> None:
         """Start the worker tasks for processing queues."""
+        # A second start (e.g. after a reconnect) must not spawn a duplicate pipeline
+        if self._supervisor is not None and not self._supervisor.done():
+            logger.debug("Worker tasks already running - not starting another set")
+            return
+
+        # Workers pull in the TTS engine and user settings, so import them only
+        # once the handler actually starts
+        from .workers.player import PlayerWorker
+        from .workers.synthesizer import SynthesizerWorker
+
         try:
             # Create workers
             synthesizer_worker = SynthesizerWorker(self, self.config)
@@ -186,17 +211,17 @@ class VoiceHandler(VoiceHandlerInterface):
             # Store worker instances for graceful shutdown
             self._synthesizer_worker = synthesizer_worker
             self.synthesizer = synthesizer_worker
-
-            # Start synthesizer worker task
-            synthesizer_task = asyncio.create_task(synthesizer_worker.run())
-            self.add_worker_task(synthesizer_task)
+            workers: list[SynthesizerWorker | PlayerWorker] = [synthesizer_worker]
 
             # Start player worker only if requested
             if start_player:
                 player_worker = PlayerWorker(self)
                 self._player_worker = player_worker
-                player_task = asyncio.create_task(player_worker.run())
-                self.add_worker_task(player_task)
+                workers.append(player_worker)
+
+            # One supervisor task owns the workers, so cancelling it stops them all
+            self._supervisor = asyncio.create_task(self._supervise(workers))
+            self.add_worker_task(self._supervisor)
 
             logger.info("✅ Worker tasks started successfully")
 
@@ -204,6 +229,16 @@ class VoiceHandler(VoiceHandlerInterface):
             logger.error(f"❌ Failed to start worker tasks: {e}")
             raise
 
+    async def _supervise(self, workers: "list[SynthesizerWorker | PlayerWorker]") -> None:
+        """Run the workers in a task group; a crash in one cancels the others."""
+        try:
+            async with asyncio.TaskGroup() as group:
+                for worker in workers:
+                    _ = group.create_task(worker.run())
+        except* Exception as crashed:
+            for error in crashed.exceptions:
+                logger.opt(exception=error).error("💥 Voice worker crashed; stopped remaining workers")
+
     def add_worker_task(self, task: asyncio.Task[None]) -> None:
         """Add a worker task to be managed by the handler."""
         self.task_manager.add_task(task)
@@ -215,47 +250,45 @@ class VoiceHandler(VoiceHandlerInterface):
         if self._player_worker:
             self._player_worker.stop()
         self.synthesizer = None
+        self._supervisor = None
         logger.info("Sent stop signal to workers")
 
     def is_connected(self) -> bool:  # type: ignore[override]
         """Check if the bot is connected to a voice channel."""
         return self.connection_manager.is_connected()
 
-    async def connect_to_channel(self, channel_id: int) -> bool:  # type: ignore[override]
+    def connect_to_channel(self, channel_id: int) -> Coroutine[Any, Any, bool]:  # type: ignore[override]
         """Connect to a voice channel using connection manager."""
-        return await self.connection_manager.connect_to_channel(channel_id)
+        return self.connection_manager.connect_to_channel(channel_id)
 
-    async def handle_voice_server_update(self, payload: dict[str, Any]) -> None:  # type: ignore[override]
+    def handle_voice_server_update(self, payload: dict[str, Any]) -> Coroutine[Any, Any, None]:  # type: ignore[override]
         """Handle VOICE_SERVER_UPDATE event with proper Discord API compliance."""
-        await self.connection_manager.handle_voice_server_update(payload)
+        return self.connection_manager.handle_voice_server_update(payload)
 
-    async def handle_voice_state_update(self, payload: dict[str, Any]) -> None:  # type: ignore[override]
+    def handle_voice_state_update(self, payload: dict[str, Any]) -> Coroutine[Any, Any, None]:  # type: ignore[override]
         """Handle VOICE_STATE_UPDATE event with proper Discord API compliance."""
-        await self.connection_manager.handle_voice_state_update(payload)
+        return self.connection_manager.handle_voice_state_update(payload)
 
-    async def make_rate_limited_request(self, api_call: Any, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+    def make_rate_limited_request(self, api_call: Any, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, Any]:  # type: ignore[override]
         """Make a rate-limited API request with circuit breaker pattern."""
-        return await self.rate_limiter_manager.make_rate_limited_request(api_call, *args, **kwargs)
+        return self.rate_limiter_manager.make_rate_limited_request(api_call, *args, **kwargs)
 
-    async def add_to_queue(self, message_data: dict[str, Any]) -> None:  # type: ignore[override]
+    def add_to_queue(self, message_data: dict[str, Any]) -> Coroutine[Any, Any, None]:  # type: ignore[override]
         """Add message to synthesis queue with deduplication."""
-        await self.queue_manager.add_to_queue(message_data)
+        return self.queue_manager.add_to_queue(message_data)
 
     async def skip_current(self) -> int:  # type: ignore[override]
         """Skip the current message group."""
         if not self.current_group_id:
             return 0
 
-        # Skip from audio queue
-        audio_skipped = await self.queue_manager.skip_current()
-
-        # Also skip from synthesis queue
-        synthesis_skipped = await self.queue_manager.clear_group_from_synthesis_queue(self.current_group_id)
+        # The handler tracks the playing group, so pass it rather than relying
+        # on the queue manager's copy
+        total_skipped = await self.queue_manager.skip_group(self.current_group_id)
 
-        total_skipped = audio_skipped + synthesis_skipped
-
-        if self.voice_client and self.voice_client.is_playing():
-            self.voice_client.stop()
+        vc = self.connection_manager.voice_client
+        if vc is not None and vc.is_playing():
+            vc.stop()
 
         self.stats_tracker.increment_messages_skipped()
         logger.info(f"Skipped {total_skipped} chunks from group {self.current_group_id}")
@@ -265,8 +298,9 @@ class VoiceHandler(VoiceHandlerInterface):
         """Clear all queues."""
         total = await self.queue_manager.clear_all()
 
-        if self.voice_client and self.voice_client.is_playing():
-            self.voice_client.stop()
+        vc = self.connection_manager.voice_client
+        if vc is not None and vc.is_playing():
+            vc.stop()
 
         logger.info(f"Cleared {total} items from queues")
         return total
@@ -275,29 +309,30 @@ class VoiceHandler(VoiceHandlerInterface):
         """Get current status information from all managers."""
         connection_info = self.connection_manager.get_connection_info()
         queue_sizes = self.queue_manager.get_queue_sizes()
-        stats = self.stats_tracker.get_stats()
+        stats = self.stats_tracker
+        playing = self.is_playing
 
         return {
             "connected": connection_info["connected"],
             "voice_connected": connection_info["connected"],
             "voice_channel_name": connection_info["channel_name"],
             "voice_channel_id": connection_info["channel_id"],
-            "playing": self.is_playing,
+            "playing": playing,
             "synthesis_queue_size": queue_sizes["synthesis_queue_size"],
             "audio_queue_size": queue_sizes["audio_queue_size"],
             "total_queue_size": queue_sizes["total_queue_size"],
             "current_group": self.current_group_id,
-            "messages_played": stats["messages_played"],
-            "messages_skipped": stats["messages_skipped"],
-            "errors": stats["errors"],
+            "messages_played": stats.messages_played,
+            "messages_skipped": stats.messages_skipped,
+            "errors": stats.errors,
             "connection_state": connection_info["connection_state"],
-            "is_playing": self.is_playing,
+            "is_playing": playing,
             "max_queue_size": 50,
         }
 
-    async def health_check(self) -> dict[str, Any]:  # type: ignore[override]
+    def health_check(self) -> Coroutine[Any, Any, dict[str, Any]]:  # type: ignore[override]
         """Perform comprehensive voice connection health check."""
-        return await self.health_monitor.perform_health_check()
+        return self.health_monitor.perform_health_check()
 
     async def cleanup(self) -> None:  # type: ignore[override]
         """Clean up resources."""
@@ -310,9 +345,10 @@ class VoiceHandler(VoiceHandlerInterface):
         _ = result  # Handle unused result
 
         await self.connection_manager.cleanup_voice_client()
+        await self.health_monitor.close()
 
         logger.info("Voice handler cleaned up")
 
-    async def cleanup_voice_client(self) -> None:  # type: ignore[override]
+    def cleanup_voice_client(self) -> Coroutine[Any, Any, None]:  # type: ignore[override]
         """Aggressively clean up voice client state."""
-        await self.connection_manager.cleanup_voice_client()
+        return self.connection_manager.cleanup_voice_client()
@@ -1,20 +1,29 @@
 """Health monitoring for voice handler."""
 
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
-from ..protocols import ConfigManager
+from ..config import Config
+
+if TYPE_CHECKING:
+    from ..tts_engine import TTSEngine
+
+# Issues that make the voice system unhealthy (as opposed to informational ones)
+_CRITICAL_ISSUE = re.compile("not initialized|not connected|failed|error", re.IGNORECASE)
 
 
 class HealthMonitor:
     """Monitors the health of voice-related components."""
 
-    def __init__(self, connection_manager: Any, config_manager: ConfigManager) -> None:
+    def __init__(self, connection_manager: Any, config: Config) -> None:
         """Initialize health monitor."""
         super().__init__()
         self.connection_manager = connection_manager
-        self._config_manager = config_manager
+        self._config = config
+        # Built on the first health check and reused, sharing the handler's config
+        self._tts_engine: TTSEngine | None = None
 
     async def perform_health_check(self) -> dict[str, Any]:
         """Perform comprehensive voice system health check."""
@@ -49,8 +58,8 @@ class HealthMonitor:
                 else:
                     logger.debug("✅ Voice client is connected")
 
-                    if hasattr(voice_client, "channel") and voice_client.channel:
-                        channel = voice_client.channel
+                    channel = getattr(voice_client, "channel", None)
+                    if channel:
                         health_status["channel_accessible"] = True
                         logger.debug(f"✅ Connected to channel: {channel.name} (ID: {channel.id})")
 
@@ -70,13 +79,7 @@ class HealthMonitor:
 
         # Check TTS synthesis capability
         try:
-            from ..config_manager import ConfigManagerImpl
-            from ..tts_engine import get_tts_engine
-
-            config_manager = ConfigManagerImpl()
-            tts_engine = await get_tts_engine(config_manager)
-
-            if await tts_engine.health_check():
+            if await self._check_tts():
                 health_status["can_synthesize"] = True
                 logger.debug("✅ TTS engine is healthy")
             else:
@@ -87,7 +90,7 @@ class HealthMonitor:
             logger.debug(f"⚠️ TTS engine check error: {e}")
 
         # Overall health assessment
-        critical_issues = [issue for issue in health_status["issues"] if any(keyword in issue.lower() for keyword in ["not initialized", "not connected", "failed", "error"])]
+        critical_issues = [issue for issue in health_status["issues"] if _CRITICAL_ISSUE.search(issue)]
 
         if not critical_issues:
             health_status["healthy"] = True
@@ -99,3 +102,26 @@ class HealthMonitor:
                 logger.debug(f"   - {issue}")
 
         return health_status
+
+    async def _check_tts(self) -> bool:
+        """Return the TTS engine's health.
+
+        Not cached here: the engine's TTSHealthMonitor owns the result TTL
+        (PROBE_TTL), so a second layer would only make the status staler.
+        """
+        tts_engine = await self._get_tts_engine()
+        return await tts_engine.health_check()
+
+    async def _get_tts_engine(self) -> "TTSEngine":
+        """Return the TTS engine used for health checks, starting it on first use."""
+        if self._tts_engine is None:
+            from ..tts_engine import get_tts_engine
+
+            self._tts_engine = await get_tts_engine(self._config)
+        return self._tts_engine
+
+    async def close(self) -> None:
+        """Close the health-check TTS engine, if one was started."""
+        if self._tts_engine is not None:
+            await self._tts_engine.close()
+            self._tts_engine = None
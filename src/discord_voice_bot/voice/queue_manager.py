@@ -1,10 +1,19 @@
 """Queue management for voice handler."""
 
-import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Any
 
 from .queues import PriorityAudioQueue, SynthesisQueue
 
+# Number of recent message hashes remembered for deduplication
+RECENT_MESSAGES_MAX = 100
+
+
+def message_fingerprint(content: str) -> int:
+    """Return a 64-bit dedup key for message content that is stable across runs."""
+    return int.from_bytes(hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest(), "big")
+
 
 class QueueManager:
     """Manages synthesis and audio queues for voice handler."""
@@ -15,54 +24,69 @@ class QueueManager:
         self.synthesis_queue = SynthesisQueue(maxsize=100)
         self.audio_queue = PriorityAudioQueue()
         self.current_group_id: str | None = None
-        self._recent_messages: list[int] = []
+        # Insertion-ordered set of recent message hashes, oldest first
+        self._recent_messages: OrderedDict[int, None] = OrderedDict()
 
     async def add_to_queue(self, message_data: dict[str, Any]) -> None:
         """Add message to synthesis queue with deduplication."""
         from loguru import logger
 
-        logger.debug(f"🎤 QUEUE: add_to_queue called with message_data keys: {list(message_data.keys())}")
-        logger.debug(f"🎤 QUEUE: message_data content preview: {str(message_data.get('original_content', ''))[:100]}")
+        # Duplicates are the cheapest rejection, so check them before anything else
+        message_hash = message_fingerprint(message_data.get("original_content") or "")
+        if message_hash in self._recent_messages:
+            logger.debug("🎤 QUEUE: Message is duplicate - skipping")
+            return
+
+        # Lazy so the previews are only built when debug logging is on
+        lazy = logger.opt(lazy=True)
+        lazy.debug("🎤 QUEUE: add_to_queue called with message_data keys: {}", lambda: list(message_data))
+        lazy.debug("🎤 QUEUE: message_data content preview: {}", lambda: str(message_data.get("original_content", ""))[:100])
 
         if not message_data.get("chunks"):
             logger.warning("🎤 QUEUE: No 'chunks' key found in message_data - message will not be queued")
             logger.warning(f"🎤 QUEUE: Available keys: {list(message_data.keys())}")
             return
 
-        logger.debug(f"🎤 QUEUE: Found {len(message_data['chunks'])} chunks to process")
+        logger.debug("🎤 QUEUE: Found {} chunks to process", len(message_data["chunks"]))
 
-        # Check for message deduplication
-        message_hash = hash(message_data.get("original_content", ""))
-        if message_hash in self._recent_messages:
-            logger.debug("🎤 QUEUE: Message is duplicate - skipping")
+        # Check queue size limits; whole messages are rejected so they are never
+        # half-queued (or block on a full queue)
+        queued = self.synthesis_queue.qsize()
+        capacity = self.synthesis_queue.maxsize
+        if queued + len(message_data["chunks"]) > capacity:
+            logger.warning(f"🎤 QUEUE: Synthesis queue is full ({queued}/{capacity}) - skipping message")
             return
 
-        # Keep only last 100 message hashes
-        if len(self._recent_messages) > 100:
-            _ = self._recent_messages.pop(0)
-        self._recent_messages.append(message_hash)
+        # Remember accepted messages, keeping only the most recent hashes
+        self._recent_messages[message_hash] = None
+        if len(self._recent_messages) > RECENT_MESSAGES_MAX:
+            _ = self._recent_messages.popitem(last=False)
 
-        # Check queue size limits
-        if self.synthesis_queue.qsize() >= 100:
-            logger.warning(f"🎤 QUEUE: Synthesis queue is full ({self.synthesis_queue.qsize()}/100) - skipping message")
-            return
+        # Per-message fields are looked up once, not per chunk
+        chunks = message_data["chunks"]
+        total_chunks = len(chunks)
+        user_id = message_data.get("user_id")
+        username = message_data.get("username", "Unknown")
+        group_id = message_data.get("group_id") or f"msg_{id(message_data)}"
 
-        logger.debug(f"🎤 QUEUE: Adding {len(message_data['chunks'])} chunks to synthesis queue")
+        logger.debug("🎤 QUEUE: Adding {} chunks to synthesis queue", total_chunks)
 
-        for i, chunk in enumerate(message_data["chunks"]):
-            item = {
+        items = [
+            {
                 "text": chunk,
-                "user_id": message_data.get("user_id"),
-                "username": message_data.get("username", "Unknown"),
-                "group_id": message_data.get("group_id", f"msg_{id(message_data)}"),
+                "user_id": user_id,
+                "username": username,
+                "group_id": group_id,
                 "chunk_index": i,
-                "total_chunks": len(message_data["chunks"]),
+                "total_chunks": total_chunks,
                 "message_hash": message_hash,
             }
-            await self.synthesis_queue.put(item)
-            logger.debug(f"🎤 QUEUE: Added chunk {i + 1}/{len(message_data['chunks'])} to queue")
+            for i, chunk in enumerate(chunks)
+        ]
+        # Capacity was checked up front, so the whole message goes in at once
+        self.synthesis_queue.put_many_nowait(items)
 
-        logger.info(f"🎤 QUEUE: Successfully queued message with {len(message_data['chunks'])} chunks from {message_data.get('username', 'Unknown')}")
+        logger.info(f"🎤 QUEUE: Successfully queued message with {total_chunks} chunks from {username}")
 
     async def skip_current(self) -> int:
         """Skip the current message group."""
@@ -72,31 +96,13 @@ class QueueManager:
         skipped = await self.audio_queue.clear_group(self.current_group_id)
         return skipped
 
+    async def skip_group(self, group_id: str) -> int:
+        """Remove a message group from both queues, returning the number of items removed."""
+        return await self.synthesis_queue.clear_group(group_id) + await self.audio_queue.clear_group(group_id)
+
     async def clear_group_from_synthesis_queue(self, group_id: str) -> int:
         """Clear items with specific group_id from synthesis queue."""
-        # This is a simplified implementation - in real scenario,
-        # you might need more sophisticated queue management
-        original_size = self.synthesis_queue.qsize()
-        temp_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self.synthesis_queue.maxsize)
-
-        # Filter out items with the specified group_id
-        while not self.synthesis_queue.empty():
-            try:
-                queue_item: dict[str, Any] = await asyncio.wait_for(self.synthesis_queue.get(), timeout=0.1)
-                if queue_item.get("group_id") != group_id:
-                    await temp_queue.put(queue_item)
-            except TimeoutError:
-                break
-
-        # Put remaining items back
-        while not temp_queue.empty():
-            try:
-                remaining_item: dict[str, Any] = await asyncio.wait_for(temp_queue.get(), timeout=0.1)
-                await self.synthesis_queue.put(remaining_item)
-            except TimeoutError:
-                break
-
-        return original_size - self.synthesis_queue.qsize()
+        return await self.synthesis_queue.clear_group(group_id)
 
     async def clear_group(self, group_id: str) -> int:
         """Clear a specific group from audio queue."""
@@ -105,6 +111,8 @@ class QueueManager:
     async def clear_all(self) -> int:
         """Clear all queues."""
         total = self.synthesis_queue.qsize() + self.audio_queue.qsize()
+        if not total:
+            return 0
 
         _ = await self.synthesis_queue.clear()
         _ = await self.audio_queue.clear()
@@ -113,7 +121,9 @@ class QueueManager:
 
     def get_queue_sizes(self) -> dict[str, int]:
         """Get current queue sizes."""
-        return {"synthesis_queue_size": self.synthesis_queue.qsize(), "audio_queue_size": self.audio_queue.qsize(), "total_queue_size": self.synthesis_queue.qsize() + self.audio_queue.qsize()}
+        synthesis_size = self.synthesis_queue.qsize()
+        audio_size = self.audio_queue.qsize()
+        return {"synthesis_queue_size": synthesis_size, "audio_queue_size": audio_size, "total_queue_size": synthesis_size + audio_size}
 
     def set_current_group(self, group_id: str | None) -> None:
         """Set the current group ID."""
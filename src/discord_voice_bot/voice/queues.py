@@ -17,6 +17,13 @@ class SynthesisQueue:
         """Add item to synthesis queue."""
         await self._queue.put(item)
 
+    def put_many_nowait(self, items: list[dict[str, Any]]) -> None:
+        """Add all items without waiting; raises QueueFull (adding none) if they don't all fit."""
+        if self._queue.qsize() + len(items) > self.maxsize:
+            raise asyncio.QueueFull
+        for item in items:
+            self._queue.put_nowait(item)
+
     async def get(self) -> dict[str, Any]:
         """Get item from synthesis queue."""
         return await self._queue.get()
@@ -31,16 +38,24 @@ class SynthesisQueue:
 
     async def clear(self) -> int:
         """Clear all items from queue."""
-        count = 0
-        while not self._queue.empty():
-            try:
-                result = self._queue.get_nowait()
-                _ = result  # Handle unused result
-                count += 1
-            except asyncio.QueueEmpty:
-                break
+        # The drain never suspends, so the size can't change underneath it;
+        # get_nowait() is kept (over emptying the internal deque) so blocked
+        # put() callers are woken as space frees up
+        count = self._queue.qsize()
+        for _ in range(count):
+            _ = self._queue.get_nowait()
         return count
 
+    async def clear_group(self, group_id: str) -> int:
+        """Remove all items with the specified group_id, keeping the order of the rest."""
+        # Drain and refill without suspending: nothing else can touch the queue
+        # in between, and put_nowait() can't overflow since nothing was added
+        items = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+        kept = [item for item in items if item.get("group_id") != group_id]
+        for item in kept:
+            self._queue.put_nowait(item)
+        return len(items) - len(kept)
+
     def get_nowait(self) -> dict[str, Any]:
         """Get item from queue without waiting (synchronous)."""
         return self._queue.get_nowait()
@@ -51,27 +66,27 @@ class PriorityAudioQueue:
 
     def __init__(self):
         super().__init__()
-        self._heap: list[tuple[int, int, str, str, int, int]] = []
+        self._heap: list[tuple[int, int, bytes | str, str, int, int]] = []
         self._lock = asyncio.Lock()
         self._counter = 0  # For FIFO ordering with same priority
 
-    async def put(self, item: tuple[str, str, int, int]) -> None:
+    async def put(self, item: tuple[bytes | str, str, int, int]) -> None:
         """Add item to priority queue with proper ordering."""
         async with self._lock:
-            # item format: (audio_path, group_id, priority, chunk_index)
-            # heap format: (priority, counter, audio_path, group_id, priority, chunk_index)
+            # item format: (audio, group_id, priority, chunk_index); audio is WAV bytes or a file path
+            # heap format: (priority, counter, audio, group_id, priority, chunk_index)
             heapq.heappush(self._heap, (item[2], self._counter, item[0], item[1], item[2], item[3]))
             self._counter += 1
 
-    async def get(self) -> tuple[str, str, int, int]:
+    async def get(self) -> tuple[bytes | str, str, int, int]:
         """Get highest priority item from queue (lowest priority number first)."""
         async with self._lock:
             if not self._heap:
                 raise asyncio.QueueEmpty("Queue is empty")
 
-            # Get item from heap: (priority, counter, audio_path, group_id, priority, chunk_index)
-            _, _, audio_path, group_id, priority, chunk_index = heapq.heappop(self._heap)
-            return (audio_path, group_id, priority, chunk_index)
+            # Get item from heap: (priority, counter, audio, group_id, priority, chunk_index)
+            _, _, audio, group_id, priority, chunk_index = heapq.heappop(self._heap)
+            return (audio, group_id, priority, chunk_index)
 
     def qsize(self) -> int:
         """Get queue size."""
@@ -92,10 +107,11 @@ class PriorityAudioQueue:
     async def clear_group(self, group_id: str) -> int:
         """Clear all items with specified group_id from queue."""
         async with self._lock:
-            # Filter out items with matching group_id
-            original_heap = self._heap[:]
-            self._heap = [item for item in original_heap if item[3] != group_id]
-            cleared_count = len(original_heap) - len(self._heap)
-            # Re-heapify after filtering
-            heapq.heapify(self._heap)
+            # Filter out items with matching group_id; the heap is only rebuilt
+            # when something was actually removed
+            kept = [item for item in self._heap if item[3] != group_id]
+            cleared_count = len(self._heap) - len(kept)
+            if cleared_count:
+                heapq.heapify(kept)
+                self._heap = kept
             return cleared_count
@@ -24,44 +24,44 @@ class RateLimiterManager:
 
     async def make_rate_limited_request(self, api_call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Make a rate-limited API request with circuit breaker pattern."""
-        # Check circuit breaker state first
-        if not await self.circuit_breaker.can_make_request():
+        # Breaker and limiter bookkeeping is synchronous; only a real delay suspends
+        if not self.circuit_breaker.can_make_request():
             raise CircuitBreakerOpenError("Circuit breaker is open")
 
-        await self.rate_limiter.wait_if_needed()
+        delay = self.rate_limiter.reserve()
+        if delay:
+            await asyncio.sleep(delay)
 
         try:
             result = await api_call(*args, **kwargs)
             # Record success in circuit breaker
-            await self.circuit_breaker.record_success()
+            self.circuit_breaker.record_success()
             return result
         except discord.HTTPException as e:
             # Record failure in circuit breaker for non-rate-limit errors
             if e.status != 429:
-                await self.circuit_breaker.record_failure()
+                self.circuit_breaker.record_failure()
 
             if e.status == 429:  # Rate limited by Discord
                 retry_after = self._extract_retry_after(e)
-                await asyncio.sleep(float(retry_after))
+                await asyncio.sleep(retry_after)
                 # Retry once after rate limit
                 return await api_call(*args, **kwargs)
             else:
                 raise
 
-    def _extract_retry_after(self, exception: discord.HTTPException) -> str:
-        """Extract retry-after value from HTTP exception."""
-        if hasattr(exception, "response") and exception.response:
-            try:
-                headers = getattr(exception.response, "headers", {})
-                if hasattr(headers, "get"):
-                    return headers.get("Retry-After", "1")
-            except (AttributeError, TypeError):
-                pass
-        return "1"
+    def _extract_retry_after(self, exception: discord.HTTPException) -> float:
+        """Extract the retry delay in seconds from an HTTP exception, defaulting to 1s."""
+        try:
+            headers = exception.response.headers
+            # Discord's bucket reset is a float in seconds; Retry-After is the fallback
+            return float(headers.get("X-RateLimit-Reset-After") or headers["Retry-After"])
+        except (KeyError, AttributeError, TypeError, ValueError):
+            return 1.0
 
     async def can_make_request(self) -> bool:
         """Check if a request can be made through the circuit breaker."""
-        return await self.circuit_breaker.can_make_request()
+        return self.circuit_breaker.can_make_request()
 
     def get_circuit_breaker_state(self) -> str:
         """Get the current circuit breaker state."""
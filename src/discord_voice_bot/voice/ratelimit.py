@@ -1,31 +1,40 @@
 """Rate limiting utilities for voice operations."""
 
+import asyncio
 import time
 from typing import Any
 
+from loguru import logger
 
-class SimpleRateLimiter:
-    """Simple rate limiter that respects Discord's global limit."""
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.last_request_time = 0.0
+class SimpleRateLimiter:
+    """Token-bucket rate limiter that respects Discord's global limit.
 
-    async def wait_if_needed(self) -> None:
-        """Wait to respect Discord's 50 requests per second global limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    The bucket is plain attribute math on a monotonic clock: a caller takes
+    its token (letting the balance go negative) before sleeping, so callers
+    that arrive together are spaced out instead of all seeing the same gap.
+    """
 
+    def __init__(self, rate: float = 50.0, capacity: float = 1.0) -> None:
+        super().__init__()
         # Discord allows 50 requests per second globally
-        min_interval = 1.0 / 50.0
-
-        if time_since_last < min_interval:
-            wait_time = min_interval - time_since_last
-            import asyncio
-
-            await asyncio.sleep(wait_time)
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a request token and return how long to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate) - 1.0
+        self.last_refill = now
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
 
-        self.last_request_time = time.time()
+    async def wait_if_needed(self) -> None:
+        """Wait until a request token is available."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
 
 
 class CircuitBreaker:
@@ -39,41 +48,33 @@ class CircuitBreaker:
         self.last_failure_time = 0.0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
 
-    async def can_make_request(self) -> bool:
+    def can_make_request(self) -> bool:
         """Check if a request can be made."""
-        current_time = time.time()
-
         if self.state == "CLOSED":
             return True
         elif self.state == "OPEN":
-            if current_time - self.last_failure_time >= self.recovery_timeout:
+            if time.monotonic() - self.last_failure_time >= self.recovery_timeout:
                 self.state = "HALF_OPEN"
-                from loguru import logger
-
                 logger.info("Circuit breaker transitioning to HALF_OPEN state")
                 return True
             return False
         else:  # HALF_OPEN
             return True
 
-    async def record_success(self) -> None:
+    def record_success(self) -> None:
         """Record a successful request."""
         if self.state == "HALF_OPEN":
             self.state = "CLOSED"
             self.failure_count = 0
-            from loguru import logger
-
             logger.info("Circuit breaker transitioning to CLOSED state")
 
-    async def record_failure(self) -> None:
+    def record_failure(self) -> None:
         """Record a failed request."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
-            from loguru import logger
-
             logger.error(f"Circuit breaker transitioning to OPEN state after {self.failure_count} failures")
 
     def get_state(self) -> dict[str, Any]:
@@ -85,6 +86,4 @@ class CircuitBreaker:
         self.state = "CLOSED"
         self.failure_count = 0
         self.last_failure_time = 0.0
-        from loguru import logger
-
         logger.info("Circuit breaker manually reset to CLOSED state")
@@ -2,47 +2,70 @@
 
 from typing import Any
 
+# Counters kept as slot attributes; other keys fall back to a plain dict
+_COUNTERS = frozenset({"messages_played", "messages_skipped", "errors"})
+
 
 class StatsTracker:
     """Manages voice handler statistics."""
 
+    __slots__ = ("_extra", "errors", "messages_played", "messages_skipped")
+
     def __init__(self) -> None:
         """Initialize stats tracker."""
         super().__init__()
-        self.stats = {"messages_played": 0, "messages_skipped": 0, "errors": 0}
+        self.messages_played = 0
+        self.messages_skipped = 0
+        self.errors = 0
+        self._extra: dict[str, Any] = {}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Dict view of the counters, built on demand."""
+        return {"messages_played": self.messages_played, "messages_skipped": self.messages_skipped, "errors": self.errors, **self._extra}
 
     def increment_messages_played(self) -> None:
         """Increment messages played counter."""
-        self.stats["messages_played"] += 1
+        self.messages_played += 1
 
     def increment_messages_skipped(self) -> None:
         """Increment messages skipped counter."""
-        self.stats["messages_skipped"] += 1
+        self.messages_skipped += 1
 
     def increment_errors(self) -> None:
         """Increment errors counter."""
-        self.stats["errors"] += 1
+        self.errors += 1
 
     def get_stats(self) -> dict[str, Any]:
         """Get current statistics."""
-        return self.stats.copy()
+        return self.stats
 
     def reset_stats(self) -> None:
         """Reset all statistics to zero."""
-        self.stats = {"messages_played": 0, "messages_skipped": 0, "errors": 0}
+        self.messages_played = 0
+        self.messages_skipped = 0
+        self.errors = 0
+        self._extra.clear()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a stat value by key, maintaining dict-like access for backward compatibility."""
-        return self.stats.get(key, default)
+        if key in _COUNTERS:
+            return getattr(self, key)
+        return self._extra.get(key, default)
 
     def current_count(self) -> int:
         """Get total count of processed messages for backward compatibility."""
-        return self.stats["messages_played"] + self.stats["messages_skipped"]
+        return self.messages_played + self.messages_skipped
 
     def __getitem__(self, key: str) -> Any:
         """Dict-like access for backward compatibility."""
-        return self.stats[key]
+        if key in _COUNTERS:
+            return getattr(self, key)
+        return self._extra[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Dict-like assignment for backward compatibility."""
-        self.stats[key] = value
+        if key in _COUNTERS:
+            setattr(self, key, value)
+        else:
+            self._extra[key] = value
@@ -25,12 +25,9 @@ class TaskManager:
             if not task.done():
                 _ = task.cancel()
 
-        # Wait for all tasks to complete cancellation
+        # Wait for all tasks to finish cancelling; their errors are returned, not raised
         if self.tasks:
-            try:
-                _ = await asyncio.gather(*self.tasks, return_exceptions=True)
-            except Exception:
-                pass  # Expected when tasks are cancelled
+            _ = await asyncio.gather(*self.tasks, return_exceptions=True)
 
         self.tasks.clear()
 
@@ -40,4 +37,4 @@ class TaskManager:
 
     def get_active_task_count(self) -> int:
         """Get the number of active (not done) tasks."""
-        return len([task for task in self.tasks if not task.done()])
+        return sum(not task.done() for task in self.tasks)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 import discord
 from loguru import logger
 
-from ..audio_utils import cleanup_file
+from ..audio_utils import audio_bytes_stream, cleanup_file, cleanup_file_async
 
 
 class VoiceHandlerProtocol(Protocol):
@@ -15,7 +15,6 @@ class VoiceHandlerProtocol(Protocol):
     audio_queue: Any
     voice_client: Any
     current_group_id: str | None
-    is_playing: bool
     stats: Any
     if TYPE_CHECKING:
         from .synthesizer import SynthesizerWorker
@@ -41,7 +40,7 @@ class PlayerWorker:
                 try:
                     # Add timeout to queue.get() to prevent indefinite blocking
                     try:
-                        audio_path, group_id, priority, chunk_index, audio_size = await asyncio.wait_for(self.voice_handler.audio_queue.get(), timeout=1.0)
+                        audio, group_id, priority, chunk_index, audio_size = await asyncio.wait_for(self.voice_handler.audio_queue.get(), timeout=1.0)
                     except TimeoutError:
                         now = asyncio.get_running_loop().time()
                         if now - getattr(self, "_last_idle_log", 0.0) >= 60.0:
@@ -50,9 +49,14 @@ class PlayerWorker:
                         await asyncio.sleep(0.1)
                         continue
 
+                    # Synthesized audio arrives as bytes; a str is a file path from a legacy producer
+                    audio_path = audio if isinstance(audio, str) else None
+                    label = audio_path or f"group {group_id} chunk {chunk_index}"
+
                     if not self.voice_handler.voice_client or not self.voice_handler.voice_client.is_connected():
-                        cleanup_file(audio_path)
-                        logger.debug(f"Skipping playback of {audio_path} (chunk: {chunk_index}) - not connected")
+                        if audio_path:
+                            await cleanup_file_async(audio_path)
+                        logger.debug(f"Skipping playback of {label} - not connected")
                         continue
 
                     # Wait if already playing with timeout protection
@@ -62,22 +66,25 @@ class PlayerWorker:
                         wait_time += 1
 
                     if wait_time >= 30:
-                        logger.warning(f"Wait timeout for playback of {audio_path}, stopping current playback")
+                        logger.warning(f"Wait timeout for playback of {label}, stopping current playback")
                         self.voice_handler.voice_client.stop()
                         await asyncio.sleep(0.1)
 
                     # Play audio with enhanced error handling
                     self.voice_handler.current_group_id = group_id
-                    self.voice_handler.is_playing = True
 
                     try:
                         loop = asyncio.get_running_loop()
-                        audio_source = discord.FFmpegPCMAudio(audio_path)
+                        if isinstance(audio, bytes):
+                            # Pipe the clip straight into FFmpeg's stdin instead of round-tripping through disk
+                            audio_source = discord.FFmpegPCMAudio(audio_bytes_stream(audio), pipe=True)
+                        else:
+                            audio_source = discord.FFmpegPCMAudio(audio)
 
                         def after_playback(
                             error: Exception | None,
                             l: asyncio.AbstractEventLoop = loop,
-                            p: str = audio_path,
+                            p: str | None = audio_path,
                             s: int = audio_size,
                         ) -> None:
                             _ = l.call_soon_threadsafe(self._playback_complete, error, p, s)
@@ -92,19 +99,19 @@ class PlayerWorker:
                             await asyncio.sleep(0.1)
                             waited += 1
                         if waited >= max_wait_iters and self.voice_handler.voice_client.is_playing():
-                            logger.warning(f"Audio playback timeout for {audio_path}")
+                            logger.warning(f"Audio playback timeout for {label}")
                             self.voice_handler.voice_client.stop()
 
-                        logger.debug(f"Playback finished or stopped for: {audio_path} (priority: {priority})")
+                        logger.debug(f"Playback finished or stopped for: {label} (priority: {priority})")
                         consecutive_errors = 0  # Reset error count on success
 
                     except Exception:
                         logger.exception("Playback error")
-                        cleanup_file(audio_path)
+                        if audio_path:
+                            await cleanup_file_async(audio_path)
                         self.voice_handler.stats.increment_errors()
                         consecutive_errors += 1
                         # Reset state since completion callback won't run
-                        self.voice_handler.is_playing = False
                         self.voice_handler.current_group_id = None
                         # Account for buffered audio which would normally be decremented in completion
                         if audio_size and self.voice_handler.synthesizer:
@@ -140,7 +147,6 @@ class PlayerWorker:
 
     def _playback_complete(self, error: Exception | None, audio_path: str | None = None, audio_size: int | None = None) -> None:
         """Handle playback completion."""
-        self.voice_handler.is_playing = False
         self.voice_handler.current_group_id = None
 
         if error:
@@ -1,7 +1,7 @@
 """Synthesizer worker for voice operations."""
 
 import asyncio
-import tempfile
+from collections.abc import Coroutine
 from typing import Any, Protocol
 
 from loguru import logger
@@ -9,7 +9,7 @@ from loguru import logger
 from ...config import Config
 from ...tts_engine import get_tts_engine
 from ...user_settings import load_user_settings
-from ..audio_utils import calculate_message_priority, cleanup_file, get_audio_size, validate_wav_format
+from ..audio_utils import calculate_message_priority, get_audio_size, validate_wav_format
 
 
 class VoiceHandlerProtocol(Protocol):
@@ -19,7 +19,7 @@ class VoiceHandlerProtocol(Protocol):
     audio_queue: Any
     stats: Any
 
-    async def add_to_queue(self, message_data: dict[str, Any]) -> None: ...
+    def add_to_queue(self, message_data: dict[str, Any]) -> Coroutine[Any, Any, None]: ...
 
 
 class SynthesizerWorker:
@@ -112,22 +112,18 @@ class SynthesizerWorker:
                         consecutive_errors += 1
                         continue
 
-                    # Save to temporary file
-                    audio_path = await self._create_temp_audio_file(audio_data)
-
-                    # Track buffer size
+                    # Track buffer size; the audio stays in memory and is piped to FFmpeg
                     self.buffer_size += audio_size
 
                     # Calculate priority and add to audio queue with timeout protection
                     priority = calculate_message_priority(item)
                     try:
                         await asyncio.wait_for(
-                            self.voice_handler.audio_queue.put((audio_path, item["group_id"], priority, item["chunk_index"], audio_size)),
+                            self.voice_handler.audio_queue.put((audio_data, item["group_id"], priority, item["chunk_index"], audio_size)),
                             timeout=1.0,
                         )
                     except TimeoutError:
                         logger.warning(f"Audio queue full, dropping synthesized audio for: {item['text'][:50]}...")
-                        cleanup_file(audio_path)
                         self.voice_handler.stats.increment_errors()
                         self.decrement_buffer_size(audio_size)
                         continue
@@ -178,10 +174,3 @@ class SynthesizerWorker:
                 before,
                 size,
             )
-
-    async def _create_temp_audio_file(self, audio_data: bytes) -> str:
-        """Create a temporary audio file with the given data."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".wav", delete=False) as f:
-            result = f.write(audio_data)
-            _ = result  # Handle unused result
-            return f.name
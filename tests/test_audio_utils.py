@@ -0,0 +1,97 @@
+"""Unit tests for voice.audio_utils module."""
+
+import asyncio
+import struct
+from pathlib import Path
+
+import pytest
+
+from discord_voice_bot.voice.audio_utils import audio_bytes_stream, calculate_message_priority, cleanup_file_async, create_temp_audio_file, get_audio_size, validate_wav_format
+
+
+def make_wav(channels: int = 1, sample_rate: int = 48000, bits_per_sample: int = 16, *, riff: bytes = b"RIFF", wave: bytes = b"WAVE") -> bytes:
+    """Build a canonical 44-byte WAV header followed by a little silence."""
+    block_align = channels * bits_per_sample // 8
+    data = b"\x00" * 64
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        riff,
+        36 + len(data),
+        wave,
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        bits_per_sample,
+        b"data",
+        len(data),
+    )
+    return header + data
+
+
+class TestValidateWavFormat:
+    """Test WAV header validation."""
+
+    def test_valid_header(self):
+        assert validate_wav_format(make_wav(channels=2))
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview, lambda data: memoryview(data).cast("H")])
+    def test_accepts_buffers(self, wrap):
+        audio = make_wav()
+
+        assert validate_wav_format(wrap(audio))
+        assert get_audio_size(wrap(audio)) == len(audio)
+
+    def test_too_short(self):
+        assert not validate_wav_format(make_wav()[:43])
+
+    @pytest.mark.parametrize("tags", [{"riff": b"RIFX"}, {"wave": b"AVI "}])
+    def test_bad_tags(self, tags: dict[str, bytes]):
+        assert not validate_wav_format(make_wav(**tags))
+
+    @pytest.mark.parametrize(
+        ("channels", "sample_rate", "bits_per_sample"),
+        [(3, 48000, 16), (1, 12345, 16), (1, 48000, 12)],
+    )
+    def test_unsupported_format(self, channels: int, sample_rate: int, bits_per_sample: int):
+        assert not validate_wav_format(make_wav(channels, sample_rate, bits_per_sample))
+
+
+class TestCalculateMessagePriority:
+    """Test queue priority calculation."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("hi", 4), ("!tts skip", 2), ("x" * 100, 5), ("x" * 201, 7), ("!" + "x" * 200, 5), ("", 4)],
+    )
+    def test_priority(self, text: str, expected: int):
+        assert calculate_message_priority({"text": text}) == expected
+
+    def test_missing_text(self):
+        assert calculate_message_priority({}) == 4
+
+
+@pytest.mark.asyncio
+class TestTempAudioFiles:
+    """Test temporary audio file handling."""
+
+    async def test_create_and_cleanup(self):
+        audio = make_wav()
+
+        path = await create_temp_audio_file(audio)
+        assert path.endswith(".wav")
+        assert await asyncio.to_thread(Path(path).read_bytes) == audio
+
+        await cleanup_file_async(path)
+        assert not await asyncio.to_thread(Path(path).exists)
+
+    async def test_audio_bytes_stream_reads_back_the_clip(self):
+        audio = make_wav()
+
+        assert audio_bytes_stream(audio).read() == audio
+
+    async def test_cleanup_missing_file_is_ignored(self, tmp_path: Path):
+        await cleanup_file_async(str(tmp_path / "missing.wav"))
@@ -0,0 +1,133 @@
+"""Unit tests for voice.connection_manager module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from discord_voice_bot.voice.connection_manager import MIN_BACKOFF_WAIT, VoiceConnectionManager
+from discord_voice_bot.voice.gateway import VoiceGatewayManager
+
+
+@pytest.fixture
+def manager() -> VoiceConnectionManager:
+    return VoiceConnectionManager(MagicMock(), MagicMock())
+
+
+class TestReconnectBackoff:
+    """Test the exponential backoff between connection attempts."""
+
+    def test_backoff_doubles_up_to_cap(self, manager: VoiceConnectionManager):
+        delays: list[float] = []
+        for failures in (0, 1, 2, 5, 6, 10_000):
+            manager._consecutive_failures = failures
+            delays.append(manager.reconnection_cooldown)
+
+        assert delays == [1.0, 2.0, 4.0, 32.0, 60.0, 60.0]
+
+    @pytest.mark.asyncio
+    async def test_failures_grow_backoff_and_success_resets_it(self, manager: VoiceConnectionManager):
+        with (
+            patch.object(VoiceConnectionManager, "_connect", new_callable=AsyncMock) as mock_connect,
+            patch("discord_voice_bot.voice.connection_manager.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_connect.return_value = False
+            assert not await manager.connect_to_channel(1)
+            assert not await manager.connect_to_channel(1)
+            assert manager.reconnection_cooldown == 4.0
+
+            mock_connect.return_value = True
+            assert await manager.connect_to_channel(1)
+
+        assert manager.reconnection_cooldown == 1.0
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_attempts_wait_with_jitter(self, manager: VoiceConnectionManager):
+        with (
+            patch.object(VoiceConnectionManager, "_connect", new_callable=AsyncMock, return_value=True),
+            patch("discord_voice_bot.voice.connection_manager.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("discord_voice_bot.voice.connection_manager.random.random", return_value=0.5),
+        ):
+            _ = await manager.connect_to_channel(1)
+            _ = await manager.connect_to_channel(1)
+
+        mock_sleep.assert_awaited_once()
+        assert 1.0 < mock_sleep.await_args.args[0] <= 1.5
+
+    @pytest.mark.asyncio
+    async def test_negligible_wait_skips_sleep(self, manager: VoiceConnectionManager):
+        manager._loop = asyncio.get_running_loop()
+        manager._next_allowed_attempt = manager._loop.time() + MIN_BACKOFF_WAIT / 10
+        with (
+            patch.object(VoiceConnectionManager, "_connect", new_callable=AsyncMock, return_value=True),
+            patch("discord_voice_bot.voice.connection_manager.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            assert await manager.connect_to_channel(1)
+
+        mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestGatewayDispatch:
+    """Test forwarding of voice gateway events."""
+
+    async def test_events_reach_current_gateway(self, manager: VoiceConnectionManager):
+        with (
+            patch.object(VoiceGatewayManager, "handle_voice_server_update", new_callable=AsyncMock) as mock_server,
+            patch.object(VoiceGatewayManager, "handle_voice_state_update", new_callable=AsyncMock) as mock_state,
+        ):
+            manager.voice_gateway = VoiceGatewayManager(MagicMock())
+            await manager.handle_voice_server_update({"token": "t"})
+            await manager.handle_voice_state_update({"session_id": "s"})
+
+        mock_server.assert_awaited_once_with({"token": "t"})
+        mock_state.assert_awaited_once_with({"session_id": "s"})
+
+    async def test_missing_gateway_is_ignored(self, manager: VoiceConnectionManager):
+        manager.voice_gateway = None
+
+        await manager.handle_voice_server_update({})
+
+
+@pytest.mark.asyncio
+class TestStageChannel:
+    """Test stage channel handling after connecting."""
+
+    async def test_speak_request_goes_through_rate_limiter(self):
+        rate_limiter = MagicMock()
+        rate_limiter.make_rate_limited_request = AsyncMock()
+        bot = MagicMock()
+        manager = VoiceConnectionManager(bot, MagicMock(), rate_limiter)
+
+        channel = MagicMock(spec=discord.StageChannel)
+        channel.connect = AsyncMock(return_value=MagicMock())
+        channel.guild.me.voice.suppress = True
+        bot.get_channel.return_value = channel
+
+        with patch("discord_voice_bot.voice.connection_manager.asyncio.sleep", new_callable=AsyncMock):
+            assert await manager._connect(1)
+
+        rate_limiter.make_rate_limited_request.assert_awaited_once_with(channel.guild.me.edit, suppress=False)
+
+    async def test_waits_for_voice_state_only_when_missing(self):
+        bot = MagicMock()
+        manager = VoiceConnectionManager(bot, MagicMock(), MagicMock(make_rate_limited_request=AsyncMock()))
+
+        channel = MagicMock(spec=discord.StageChannel)
+        channel.connect = AsyncMock(return_value=MagicMock())
+        channel.guild.me.voice = None
+        bot.get_channel.return_value = channel
+
+        async def deliver_voice_state(*_args: object, **_kwargs: object) -> None:
+            channel.guild.me.voice = MagicMock(suppress=True)
+
+        bot.wait_for = AsyncMock(side_effect=deliver_voice_state)
+
+        with patch("discord_voice_bot.voice.connection_manager.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            assert await manager._connect(1)
+
+        bot.wait_for.assert_awaited_once()
+        assert bot.wait_for.await_args.args == ("voice_state_update",)
+        mock_sleep.assert_awaited_once_with(0.5)
+        manager._rate_limiter.make_rate_limited_request.assert_awaited_once()
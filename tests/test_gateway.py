@@ -0,0 +1,23 @@
+"""Unit tests for voice.gateway module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from discord_voice_bot.voice.gateway import VoiceGatewayManager
+
+
+@pytest.mark.asyncio
+class TestVoiceServerUpdate:
+    """Test VOICE_SERVER_UPDATE handling."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [("wss://tokyo123.discord.media:443", "tokyo123.discord.media:443"), ("tokyo123.discord.media:443", "tokyo123.discord.media:443"), (None, None)],
+    )
+    async def test_endpoint_protocol_is_stripped(self, endpoint: str | None, expected: str | None):
+        gateway = VoiceGatewayManager(MagicMock())
+
+        await gateway.handle_voice_server_update({"token": "t", "guild_id": 1, "endpoint": endpoint})
+
+        assert gateway.get_connection_info()["endpoint"] == expected
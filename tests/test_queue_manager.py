@@ -0,0 +1,137 @@
+"""Unit tests for voice.queue_manager module."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from discord_voice_bot.voice.queue_manager import RECENT_MESSAGES_MAX, QueueManager, message_fingerprint
+
+
+def make_message(content: str, chunks: list[str] | None = None, group_id: str = "group") -> dict[str, Any]:
+    return {"original_content": content, "chunks": chunks or [content], "user_id": 1, "username": "user", "group_id": group_id}
+
+
+@pytest.mark.asyncio
+class TestDeduplication:
+    """Test recent-message deduplication."""
+
+    async def test_duplicate_is_skipped(self):
+        manager = QueueManager()
+
+        await manager.add_to_queue(make_message("hello"))
+        await manager.add_to_queue(make_message("hello"))
+
+        assert manager.synthesis_queue.qsize() == 1
+
+    async def test_duplicate_is_rejected_before_inspecting_chunks(self):
+        manager = QueueManager()
+        await manager.add_to_queue(make_message("hello"))
+
+        duplicate = make_message("hello")
+        del duplicate["chunks"]
+        await manager.add_to_queue(duplicate)
+
+        assert manager.synthesis_queue.qsize() == 1
+
+    async def test_oldest_hash_is_forgotten(self):
+        manager = QueueManager()
+
+        await manager.add_to_queue(make_message("first"))
+        _ = await manager.synthesis_queue.clear()
+        for i in range(RECENT_MESSAGES_MAX):
+            await manager.add_to_queue(make_message(f"message {i}"))
+        _ = await manager.synthesis_queue.clear()
+        await manager.add_to_queue(make_message("first"))
+
+        assert manager.synthesis_queue.qsize() == 1
+        assert len(manager._recent_messages) == RECENT_MESSAGES_MAX
+
+
+@pytest.mark.asyncio
+class TestChunkItems:
+    """Test the synthesis items built for each chunk."""
+
+    async def test_items_share_message_fields(self):
+        manager = QueueManager()
+
+        await manager.add_to_queue(make_message("one two", chunks=["one", "two"], group_id="g1"))
+
+        items = [await manager.synthesis_queue.get() for _ in range(2)]
+        assert [item["text"] for item in items] == ["one", "two"]
+        assert [item["chunk_index"] for item in items] == [0, 1]
+        assert {(item["group_id"], item["total_chunks"], item["username"]) for item in items} == {("g1", 2, "user")}
+
+    async def test_missing_group_id_is_generated(self):
+        manager = QueueManager()
+        message = make_message("hello")
+        message["group_id"] = None
+
+        await manager.add_to_queue(message)
+
+        assert (await manager.synthesis_queue.get())["group_id"] == f"msg_{id(message)}"
+
+
+@pytest.mark.asyncio
+class TestCapacity:
+    """Test the synthesis queue size limit."""
+
+    async def test_message_that_does_not_fit_is_rejected_whole(self):
+        manager = QueueManager()
+        for i in range(manager.synthesis_queue.maxsize - 1):
+            await manager.add_to_queue(make_message(f"message {i}"))
+
+        await manager.add_to_queue(make_message("too long", chunks=["a", "b"]))
+
+        assert manager.synthesis_queue.qsize() == manager.synthesis_queue.maxsize - 1
+        # Rejected messages aren't remembered, so a retry after draining is accepted
+        _ = await manager.synthesis_queue.clear()
+        await manager.add_to_queue(make_message("too long", chunks=["a", "b"]))
+        assert manager.synthesis_queue.qsize() == 2
+
+
+class TestMessageFingerprint:
+    """Test the dedup key derived from message content."""
+
+    def test_fingerprint_is_stable_64_bit(self):
+        # Fixed value: the key must not depend on per-process hash randomization
+        assert message_fingerprint("hello") == 0xA7B6EDA801E5347D
+        assert message_fingerprint("hello") != message_fingerprint("hello!")
+
+
+@pytest.mark.asyncio
+class TestSkipGroup:
+    """Test removing a message group from both queues."""
+
+    async def test_skip_group_clears_both_queues(self):
+        manager = QueueManager()
+        await manager.add_to_queue(make_message("one two", chunks=["one", "two"], group_id="g1"))
+        await manager.add_to_queue(make_message("other", group_id="g2"))
+        await manager.audio_queue.put((b"audio", "g1", 1, 0))
+        await manager.audio_queue.put((b"audio", "g2", 1, 0))
+
+        assert await manager.skip_group("g1") == 3
+
+        assert manager.synthesis_queue.qsize() == 1
+        assert manager.audio_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+class TestClearAll:
+    """Test clearing both queues."""
+
+    async def test_clear_all_reports_removed_items(self):
+        manager = QueueManager()
+        await manager.add_to_queue(make_message("one two", chunks=["one", "two"]))
+        await manager.audio_queue.put((b"audio", "group", 1, 0))
+
+        assert await manager.clear_all() == 3
+        assert manager.get_queue_sizes()["total_queue_size"] == 0
+
+    async def test_clear_all_skips_empty_queues(self):
+        manager = QueueManager()
+
+        with patch.object(manager.synthesis_queue, "clear") as mock_clear:
+            assert await manager.clear_all() == 0
+
+        mock_clear.assert_not_called()
@@ -0,0 +1,72 @@
+"""Unit tests for voice.queues module."""
+
+import asyncio
+
+import pytest
+
+from discord_voice_bot.voice.queues import PriorityAudioQueue, SynthesisQueue
+
+
+@pytest.mark.asyncio
+class TestSynthesisQueueClear:
+    """Test clearing the synthesis queue."""
+
+    async def test_clear_returns_count(self):
+        queue = SynthesisQueue(maxsize=5)
+        for i in range(3):
+            await queue.put({"text": str(i)})
+
+        assert await queue.clear() == 3
+        assert queue.empty()
+
+    async def test_clear_wakes_blocked_put(self):
+        queue = SynthesisQueue(maxsize=1)
+        await queue.put({"text": "first"})
+        blocked = asyncio.create_task(queue.put({"text": "second"}))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        _ = await queue.clear()
+        await asyncio.wait_for(blocked, timeout=1)
+
+        assert (await queue.get())["text"] == "second"
+
+    async def test_clear_group_keeps_other_items_in_order(self):
+        queue = SynthesisQueue(maxsize=5)
+        for text, group in [("a", "g1"), ("b", "g2"), ("c", "g1"), ("d", "g3")]:
+            await queue.put({"text": text, "group_id": group})
+
+        assert await queue.clear_group("g1") == 2
+
+        assert [queue.get_nowait()["text"] for _ in range(queue.qsize())] == ["b", "d"]
+
+    async def test_put_many_is_all_or_nothing(self):
+        queue = SynthesisQueue(maxsize=3)
+        queue.put_many_nowait([{"text": "a"}, {"text": "b"}])
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_many_nowait([{"text": "c"}, {"text": "d"}])
+
+        assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+class TestPriorityAudioQueueClearGroup:
+    """Test removing one group from the audio heap."""
+
+    async def test_remaining_items_keep_priority_order(self):
+        queue = PriorityAudioQueue()
+        for audio, group, priority in [("a", "g1", 3), ("b", "g2", 2), ("c", "g1", 1), ("d", "g3", 4)]:
+            await queue.put((audio, group, priority, 0))
+
+        assert await queue.clear_group("g1") == 2
+
+        assert [(await queue.get())[0] for _ in range(queue.qsize())] == ["b", "d"]
+
+    async def test_unknown_group_leaves_heap_untouched(self):
+        queue = PriorityAudioQueue()
+        await queue.put(("a", "g1", 1, 0))
+        heap = queue._heap
+
+        assert await queue.clear_group("missing") == 0
+        assert queue._heap is heap
@@ -0,0 +1,91 @@
+"""Unit tests for voice.ratelimit and voice.rate_limiter_manager modules."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from discord_voice_bot.voice.rate_limiter_manager import RateLimiterManager
+from discord_voice_bot.voice.ratelimit import CircuitBreaker, SimpleRateLimiter
+
+
+@pytest.mark.asyncio
+class TestTokenBucket:
+    """Test the token-bucket rate limiter."""
+
+    async def test_first_request_is_not_delayed(self):
+        limiter = SimpleRateLimiter()
+
+        with patch("discord_voice_bot.voice.ratelimit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await limiter.wait_if_needed()
+
+        mock_sleep.assert_not_awaited()
+
+    async def test_reserve_returns_delay_without_suspending(self):
+        limiter = SimpleRateLimiter(rate=50.0)
+
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(0.02, abs=0.005)
+
+    async def test_concurrent_callers_are_spaced_out(self):
+        limiter = SimpleRateLimiter(rate=50.0)
+        await limiter.wait_if_needed()
+
+        with patch("discord_voice_bot.voice.ratelimit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            _ = await asyncio.gather(*(limiter.wait_if_needed() for _ in range(3)))
+
+        waits = sorted(call.args[0] for call in mock_sleep.await_args_list)
+        assert len(waits) == 3
+        assert waits[0] == pytest.approx(0.02, abs=0.005)
+        assert waits[2] == pytest.approx(0.06, abs=0.005)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_opens_after_threshold_and_recovers(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == "CLOSED"
+        breaker.record_failure()
+        assert breaker.state == "OPEN"
+
+        assert breaker.can_make_request()
+        assert breaker.state == "HALF_OPEN"
+        breaker.record_success()
+        assert breaker.state == "CLOSED"
+
+    def test_wall_clock_jump_does_not_close_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+        breaker.record_failure()
+
+        with patch("discord_voice_bot.voice.ratelimit.time.time", return_value=time.time() + 3600):
+            assert not breaker.can_make_request()
+        assert breaker.state == "OPEN"
+
+
+class TestRetryAfter:
+    """Test retry delay extraction from 429 responses."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"Retry-After": "0.5"}, 0.5),
+            ({"Retry-After": "2", "X-RateLimit-Reset-After": "1.25"}, 1.25),
+            ({}, 1.0),
+            ({"Retry-After": "soon"}, 1.0),
+        ],
+    )
+    def test_extract_retry_after(self, headers: dict[str, str], expected: float):
+        exception = MagicMock(spec=discord.HTTPException)
+        exception.response = MagicMock(headers=headers)
+
+        assert RateLimiterManager()._extract_retry_after(exception) == expected
+
+    def test_missing_response_defaults(self):
+        exception = MagicMock(spec=discord.HTTPException)
+        exception.response = None
+
+        assert RateLimiterManager()._extract_retry_after(exception) == 1.0
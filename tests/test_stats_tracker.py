@@ -0,0 +1,37 @@
+"""Unit tests for voice.stats_tracker module."""
+
+import pytest
+
+from discord_voice_bot.voice.stats_tracker import StatsTracker
+
+
+class TestCounters:
+    """Test the slot-backed counters and their dict-like view."""
+
+    def test_increments_show_in_dict_view(self):
+        tracker = StatsTracker()
+        tracker.increment_messages_played()
+        tracker.increment_messages_played()
+        tracker.increment_errors()
+
+        assert tracker.get_stats() == {"messages_played": 2, "messages_skipped": 0, "errors": 1}
+        assert tracker["messages_played"] == 2
+        assert tracker.current_count() == 2
+
+    def test_item_assignment_updates_counters(self):
+        tracker = StatsTracker()
+        tracker["messages_skipped"] = 4
+
+        assert tracker.messages_skipped == 4
+
+    def test_other_keys_are_kept_separately(self):
+        tracker = StatsTracker()
+        tracker["uptime_start"] = 1.5
+
+        assert tracker.get("uptime_start") == 1.5
+        assert tracker.get("missing", 0) == 0
+        with pytest.raises(KeyError):
+            _ = tracker["missing"]
+
+        tracker.reset_stats()
+        assert tracker.get_stats() == {"messages_played": 0, "messages_skipped": 0, "errors": 0}
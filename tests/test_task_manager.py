@@ -0,0 +1,35 @@
+"""Unit tests for voice.task_manager module."""
+
+import asyncio
+
+import pytest
+
+from discord_voice_bot.voice.task_manager import TaskManager
+
+
+@pytest.mark.asyncio
+class TestCleanup:
+    """Test task cancellation on cleanup."""
+
+    async def test_cleanup_waits_for_cancelled_tasks(self):
+        manager = TaskManager()
+        finished: list[str] = []
+
+        async def worker(name: str) -> None:
+            try:
+                await asyncio.sleep(10)
+            finally:
+                finished.append(name)
+
+        async def failing() -> None:
+            raise RuntimeError("boom")
+
+        manager.add_task(asyncio.create_task(worker("a")))
+        manager.add_task(asyncio.create_task(worker("b")))
+        manager.add_task(asyncio.create_task(failing()))
+        await asyncio.sleep(0)
+
+        await manager.cleanup()
+
+        assert sorted(finished) == ["a", "b"]
+        assert manager.get_task_count() == 0
@@ -0,0 +1,61 @@
+"""Unit tests for tts_client module."""
+
+import dataclasses
+from types import MappingProxyType
+
+import pytest
+
+from discord_voice_bot.config import Config
+from discord_voice_bot.tts_client import TTSClient
+
+
+@pytest.mark.asyncio
+class TestSessionLifecycle:
+    """Test that the HTTP session follows the configured engine URLs."""
+
+    async def test_session_reused_for_same_config(self, config: Config):
+        client = TTSClient(config)
+        first = await client.ensure_session()
+        second = await client.ensure_session()
+
+        assert first is second
+        await client.close_session()
+
+    async def test_session_kept_when_urls_unchanged(self, config: Config):
+        client = TTSClient(config)
+        first = await client.ensure_session()
+
+        client.config = dataclasses.replace(config, tts_speaker="3")
+        second = await client.ensure_session()
+
+        assert first is second
+        await client.close_session()
+
+    async def test_session_rebuilt_when_url_changes(self, config: Config):
+        client = TTSClient(config)
+        first = await client.ensure_session()
+
+        engines = {"voicevox": MappingProxyType({**config.engines["voicevox"], "url": "http://localhost:50022"})}
+        client.config = dataclasses.replace(config, engines=MappingProxyType(engines))
+        second = await client.ensure_session()
+
+        assert first is not second
+        assert first.closed
+        await client.close_session()
+
+
+class TestSpeakerId:
+    """Test speaker ID resolution."""
+
+    def test_numeric_speaker(self, config: Config):
+        client = TTSClient(dataclasses.replace(config, tts_speaker=" 7 "))
+
+        assert client.speaker_id == 7
+
+    def test_resolution_follows_config_replacement(self, config: Config):
+        client = TTSClient(dataclasses.replace(config, tts_speaker="7"))
+        assert client.speaker_id == 7
+
+        client.config = dataclasses.replace(config, tts_speaker="1")
+
+        assert client.speaker_id == 1
@@ -1,5 +1,7 @@
 """Unit tests for tts_engine module."""
 
+import dataclasses
+from types import MappingProxyType
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -90,6 +92,32 @@ class TestSynthesizeAudio:
         mock_gen_query.assert_called_once_with("test", None, "aivis")
         mock_synth_query.assert_called_once()
 
+    async def test_debug_save_runs_in_background(self, tts_engine_with_mocks):
+        """The debug copy is written off the request path and flushed on close."""
+        engine, _, _, _, _ = tts_engine_with_mocks
+
+        with patch("discord_voice_bot.audio_debugger.audio_debugger.save_audio_stage", return_value="saved.wav") as mock_save:
+            result = await engine.synthesize_audio("test")
+            assert result == b"mocked_audio_data"
+
+            await engine.close()
+
+        mock_save.assert_called_once()
+        assert mock_save.call_args.args[1] == "tts_raw"
+
+    async def test_debug_save_skipped_without_debug(self, tts_engine_with_mocks, config: Config):
+        """Production runs should not write a debug copy per utterance."""
+        engine, _, _, _, _ = tts_engine_with_mocks
+        engine.config = dataclasses.replace(config, debug=False)
+
+        with patch("discord_voice_bot.audio_debugger.audio_debugger.save_audio_stage") as mock_save:
+            result = await engine.synthesize_audio("test")
+            await engine.close()
+
+        assert result == b"mocked_audio_data"
+        mock_save.assert_not_called()
+
+
 @pytest.mark.asyncio
 class TestEngineLifecycle:
     """Test engine lifecycle methods."""
@@ -106,3 +134,96 @@ class TestEngineLifecycle:
         mock_close_session.assert_awaited()
         # Verify idempotency
         assert mock_close_session.await_count >= 1
+
+
+@pytest.mark.asyncio
+class TestCaching:
+    """Test the audio query and audio data caches."""
+
+    async def test_audio_query_is_cached_per_text_and_speaker(self, config: Config):
+        with patch("discord_voice_bot.tts_engine.TTSClient.generate_audio_query", new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = {"speedScale": 1.0, "accent_phrases": []}
+            engine = TTSEngine(config)
+
+            first = await engine._generate_audio_query("hello")
+            assert first is not None
+            first["speedScale"] = 2.0
+            second = await engine._generate_audio_query("hello")
+            _ = await engine._generate_audio_query("hello", speaker_id=1)
+
+        assert second == {"speedScale": 1.0, "accent_phrases": []}
+        assert mock_query.await_count == 2
+
+    async def test_audio_bytes_cached_only_when_enabled(self, tts_engine_with_mocks, config: Config):
+        engine, _, mock_synth_query, _, _ = tts_engine_with_mocks
+
+        _ = await engine.synthesize_audio("test")
+        _ = await engine.synthesize_audio("test")
+        assert mock_synth_query.await_count == 2
+
+        engine.config = dataclasses.replace(config, tts_cache_bytes=True)
+        _ = await engine.synthesize_audio("test")
+        assert await engine.synthesize_audio("test") == b"mocked_audio_data"
+        assert mock_synth_query.await_count == 3
+
+    async def test_close_clears_caches(self, tts_engine_with_mocks, config: Config):
+        engine, _, mock_synth_query, _, _ = tts_engine_with_mocks
+        engine.config = dataclasses.replace(config, tts_cache_bytes=True)
+
+        _ = await engine.synthesize_audio("test")
+        await engine.close()
+        _ = await engine.synthesize_audio("test")
+
+        assert mock_synth_query.await_count == 2
+
+
+class TestEngineResolution:
+    """Test engine/speaker/URL resolution for synthesis requests."""
+
+    def test_defaults_and_overrides(self, config: Config):
+        engine = TTSEngine(config)
+
+        assert engine._resolve_engine(None, None) == ("voicevox", 3, "http://localhost:50021")
+        assert engine._resolve_engine(7, None) == ("voicevox", 7, "http://localhost:50021")
+        # Unconfigured engines fall back to the VOICEVOX settings
+        assert engine._resolve_engine(None, "aivis") == ("aivis", 3, "http://localhost:50021")
+
+    def test_resolution_follows_config_replacement(self, config: Config):
+        engine = TTSEngine(config)
+        assert engine._resolve_engine(None, None) == ("voicevox", 3, "http://localhost:50021")
+
+        engines = {"voicevox": {**config.engines["voicevox"], "url": "http://localhost:50022", "default_speaker": 1}}
+        engine.config = dataclasses.replace(config, engines=engines)
+
+        assert engine._resolve_engine(None, None) == ("voicevox", 1, "http://localhost:50022")
+
+
+@pytest.mark.asyncio
+class TestAvailableSpeakers:
+    """Test the speaker listing."""
+
+    async def test_speakers_are_built_at_start_and_reused(self, config: Config):
+        engine = TTSEngine(config)
+        with patch.object(engine._tts_client, "start_session", new_callable=AsyncMock):
+            await engine.start()
+
+        speakers = engine.get_available_speakers()
+
+        assert speakers == {"normal": 3}
+        assert isinstance(speakers, MappingProxyType)
+        assert engine.get_available_speakers() is speakers
+
+    async def test_speakers_follow_config_replacement(self, config: Config):
+        engine = TTSEngine(config)
+        first = engine.get_available_speakers()
+
+        engines = MappingProxyType({"voicevox": MappingProxyType({**config.engines["voicevox"], "speakers": {"tsun": 7}})})
+        engine.config = dataclasses.replace(config, engines=engines)
+
+        assert first == {"normal": 3}
+        assert engine.get_available_speakers() == {"tsun": 7}
+
+    async def test_unknown_engine_has_no_speakers(self, config: Config):
+        engine = TTSEngine(dataclasses.replace(config, tts_engine="missing"))
+
+        assert engine.get_available_speakers() == {}
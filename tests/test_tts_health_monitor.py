@@ -0,0 +1,67 @@
+"""Unit tests for tts_health_monitor module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from discord_voice_bot.config import Config
+from discord_voice_bot.tts_health_monitor import TTSHealthMonitor
+
+
+def make_client(api_available: bool = True, audio: bytes | None = b"\x00" * 200) -> MagicMock:
+    client = MagicMock()
+    client.check_api_availability = AsyncMock(return_value=(api_available, "" if api_available else "connection refused"))
+    client.synthesize_audio = AsyncMock(return_value=audio)
+    return client
+
+
+@pytest.mark.asyncio
+class TestProbeSharing:
+    """Test that health queries share one backend probe."""
+
+    async def test_health_queries_share_probe(self, config: Config):
+        client = make_client()
+        monitor = TTSHealthMonitor(config, client)
+
+        assert await monitor.perform_health_check() is True
+        status = await monitor.get_health_status()
+        issues = await monitor.diagnose_issues()
+
+        assert status["healthy"] is True
+        assert issues == ["✅ No issues detected - TTS engine appears healthy"]
+        client.check_api_availability.assert_awaited_once()
+        client.synthesize_audio.assert_awaited_once()
+
+    async def test_concurrent_queries_single_flight(self, config: Config):
+        client = make_client()
+        monitor = TTSHealthMonitor(config, client)
+
+        results = await asyncio.gather(*(monitor.perform_health_check() for _ in range(5)))
+
+        assert results == [True] * 5
+        client.synthesize_audio.assert_awaited_once()
+
+    async def test_probe_expires_after_ttl(self, config: Config):
+        client = make_client()
+        monitor = TTSHealthMonitor(config, client)
+
+        _ = await monitor._probe(ttl=0.0)
+        _ = await monitor._probe(ttl=0.0)
+
+        assert client.check_api_availability.await_count == 2
+
+    async def test_api_down_skips_synthesis(self, config: Config):
+        client = make_client(api_available=False)
+        monitor = TTSHealthMonitor(config, client)
+
+        assert await monitor.perform_health_check() is False
+        status = await monitor.get_health_status()
+
+        assert status["issues"] == ["API not available: connection refused", "Audio synthesis test failed"]
+        client.synthesize_audio.assert_not_awaited()
+
+    async def test_small_audio_is_unhealthy(self, config: Config):
+        monitor = TTSHealthMonitor(config, make_client(audio=b"\x00" * 10))
+
+        assert await monitor.perform_health_check() is False
@@ -0,0 +1,230 @@
+"""Unit tests for user_settings module."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from discord_voice_bot.user_settings import SAVE_DEBOUNCE, UserSettings, load_user_settings
+
+
+@pytest.fixture
+def settings_path(tmp_path: Path) -> Path:
+    return tmp_path / "user_settings.json"
+
+
+class TestReloadGating:
+    """Test that the settings file is only re-parsed when it changes."""
+
+    def test_unchanged_file_is_not_reparsed(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+
+        with patch("discord_voice_bot.user_settings._loads") as mock_load:
+            assert settings.get_user_speaker("1") == 3
+            assert settings.get_user_settings("1") is not None
+            _ = settings.list_all_settings()
+
+        mock_load.assert_not_called()
+
+    def test_external_write_is_picked_up(self, settings_path: Path):
+        reader = UserSettings(settings_path)
+        writer = UserSettings(settings_path)
+
+        assert writer.set_user_speaker("1", 7, "tsun", "voicevox")
+
+        assert reader.get_user_speaker("1") == 7
+
+    def test_hand_edited_file_is_migrated(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        _ = settings_path.write_text(json.dumps({"1": {"speaker_id": 5, "speaker_name": "sexy"}}), encoding="utf-8")
+
+        assert settings.get_user_settings("1") == {"speaker_id": 5, "speaker_name": "sexy", "engine": "voicevox"}
+
+    def test_deleted_file_clears_settings(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+
+        settings_path.unlink()
+
+        assert settings.get_user_speaker("1") is None
+
+
+@pytest.mark.asyncio
+class TestDebouncedSave:
+    """Test that writes inside an event loop are coalesced off the loop thread."""
+
+    async def test_rapid_updates_coalesce_into_one_write(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+
+        with patch.object(settings, "_write_settings", wraps=settings._write_settings) as mock_write:
+            assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+            assert settings.set_user_speaker("2", 7, "tsun", "voicevox")
+            assert mock_write.call_count == 0
+            await asyncio.sleep(SAVE_DEBOUNCE + 0.2)
+
+        assert mock_write.call_count == 1
+        saved = json.loads(await asyncio.to_thread(settings_path.read_text, encoding="utf-8"))
+        assert set(saved) >= {"1", "2"}
+
+    async def test_migration_writes_coalesce_off_the_loop(self, settings_path: Path):
+        legacy = json.dumps({"1": {"speaker_id": 3}, "2": {"speaker_id": 1512153250}})
+        _ = await asyncio.to_thread(settings_path.write_text, legacy, encoding="utf-8")
+
+        with patch.object(UserSettings, "_write_settings", autospec=True, side_effect=UserSettings._write_settings) as mock_write:
+            settings = UserSettings(settings_path)
+            assert mock_write.call_count == 0
+            await asyncio.sleep(SAVE_DEBOUNCE + 0.2)
+
+        assert mock_write.call_count == 1
+        saved = json.loads(await asyncio.to_thread(settings_path.read_text, encoding="utf-8"))
+        assert saved == settings.settings
+
+    async def test_flush_writes_pending_changes(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+
+        settings.flush()
+
+        saved = json.loads(await asyncio.to_thread(settings_path.read_text, encoding="utf-8"))
+        assert saved["1"]["speaker_id"] == 3
+
+    async def test_save_keeps_users_written_by_other_instances(self, settings_path: Path):
+        initial = json.dumps({"1": {"speaker_id": 3, "speaker_name": "normal", "engine": "voicevox"}})
+        _ = await asyncio.to_thread(settings_path.write_text, initial, encoding="utf-8")
+        settings = UserSettings(settings_path)
+        assert settings.remove_user_speaker("1")
+        assert settings.set_user_speaker("2", 7, "tsun", "voicevox")
+
+        external = {"1": {"speaker_id": 3, "speaker_name": "normal", "engine": "voicevox"}, "3": {"speaker_id": 5, "speaker_name": "sexy", "engine": "voicevox"}}
+        _ = await asyncio.to_thread(settings_path.write_text, json.dumps(external), encoding="utf-8")
+
+        assert settings.get_user_settings("1") is None
+        assert settings.get_user_speaker("3") == 5
+        settings.flush()
+
+        saved = json.loads(await asyncio.to_thread(settings_path.read_text, encoding="utf-8"))
+        assert set(saved) == {"2", "3"}
+
+
+class TestSharedInstance:
+    """Test that commands and the synthesizer share one settings instance."""
+
+    def test_load_user_settings_returns_one_instance(self):
+        load_user_settings.cache_clear()
+        try:
+            with patch("discord_voice_bot.user_settings.UserSettings") as mock_cls:
+                assert load_user_settings() is load_user_settings()
+            mock_cls.assert_called_once_with()
+        finally:
+            load_user_settings.cache_clear()
+
+
+class TestReturnedCopies:
+    """Test that getters don't expose the cached records."""
+
+    def test_list_all_settings_is_detached(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+
+        snapshot = settings.list_all_settings()
+        snapshot["1"]["speaker_id"] = 99
+        snapshot["2"] = {}
+
+        assert settings.get_user_speaker("1") == 3
+        assert "2" not in settings.settings
+
+    def test_get_user_settings_is_detached(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+
+        record = settings.get_user_settings("1")
+        assert record is not None
+        record["speaker_id"] = 99
+
+        assert settings.get_user_speaker("1") == 3
+
+
+class TestAggregates:
+    """Test the index-backed statistics queries."""
+
+    def test_stats_track_updates_and_removals(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+        assert settings.set_user_speaker("2", 3, "normal", "voicevox")
+        assert settings.set_user_speaker("3", 888753760, "anneli", "aivis")
+        assert settings.set_user_speaker("2", 1512153250, "zunda", "aivis")
+        assert settings.remove_user_speaker("1")
+
+        assert settings.get_stats() == {
+            "total_users": 2,
+            "speaker_distribution": {"anneli": 1, "zunda": 1},
+            "engine_distribution": {"aivis": 2},
+        }
+
+    def test_stats_follow_external_writes(self, settings_path: Path):
+        reader = UserSettings(settings_path)
+        writer = UserSettings(settings_path)
+        assert writer.set_user_speaker("1", 3, "normal", "voicevox")
+
+        assert reader.get_stats()["engine_distribution"] == {"voicevox": 1}
+
+    def test_engine_compatibility_info(self, settings_path: Path):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", 3, "normal", "voicevox")
+        assert settings.set_user_speaker("2", 1512153250, "zunda", "aivis")
+
+        info = settings.get_engine_compatibility_info("voicevox")
+
+        assert [user["user_id"] for user in info["compatible_users"]] == ["1"]
+        assert info["mapped_users"] == [
+            {
+                "user_id": "2",
+                "original_speaker_id": 1512153250,
+                "mapped_speaker_id": 3,
+                "speaker_name": "zunda",
+                "original_engine": "aivis",
+                "current_engine": "voicevox",
+            }
+        ]
+
+
+class TestEngineDetection:
+    """Test engine inference for records that don't name one."""
+
+    @pytest.mark.parametrize(("speaker_id", "expected"), [(3, "voicevox"), (22, "voicevox"), (1512153250, "aivis")])
+    def test_set_user_speaker_detects_engine(self, settings_path: Path, speaker_id: int, expected: str):
+        settings = UserSettings(settings_path)
+        assert settings.set_user_speaker("1", speaker_id)
+
+        assert settings.settings["1"]["engine"] == expected
+
+    @pytest.mark.parametrize(("speaker_id", "expected"), [(7, "voicevox"), (22, "aivis"), (1512153250, "aivis")])
+    def test_migration_detects_engine(self, settings_path: Path, speaker_id: int, expected: str):
+        _ = settings_path.write_text(json.dumps({"1": {"speaker_id": speaker_id}}), encoding="utf-8")
+
+        settings = UserSettings(settings_path)
+
+        assert settings.settings["1"]["engine"] == expected
+
+
+class TestSpeakerMapping:
+    """Test cross-engine speaker mapping."""
+
+    @pytest.mark.parametrize(
+        ("speaker_id", "from_engine", "to_engine", "expected"),
+        [
+            (3, "voicevox", "voicevox", 3),
+            (7, "voicevox", "aivis", 1512153252),
+            (1512153249, "aivis", "voicevox", 1),
+            (999, "voicevox", "aivis", 1512153250),
+            (999, "aivis", "voicevox", 3),
+            (999, "voicevox", "other", 999),
+        ],
+    )
+    def test_map_speaker_to_engine(self, settings_path: Path, speaker_id: int, from_engine: str, to_engine: str, expected: int):
+        settings = UserSettings(settings_path)
+
+        assert settings._map_speaker_to_engine(speaker_id, from_engine, to_engine) == expected
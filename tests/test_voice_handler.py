@@ -194,6 +194,17 @@ class TestQueueManagement:
         assert voice_handler.audio_queue.empty()
         assert cleared == 2
 
+    @pytest.mark.asyncio
+    async def test_clear_all_stops_live_playback(self, voice_handler: VoiceHandler) -> None:
+        """Playback is stopped on the connection manager's current client."""
+        voice_client = MagicMock()
+        voice_client.is_playing.return_value = True
+        voice_handler.connection_manager.voice_client = voice_client
+
+        _ = await voice_handler.clear_all()
+
+        voice_client.stop.assert_called_once()
+
 
 class TestStatusGeneration:
     """Test status information generation."""
@@ -205,7 +216,8 @@ class TestStatusGeneration:
         await voice_handler.synthesis_queue.put({"text": "item1"})
         await voice_handler.audio_queue.put(("path1", "group1", 1, 1024))
 
-        voice_handler.is_playing = True
+        voice_handler.connection_manager.voice_client = MagicMock()
+        voice_handler.connection_manager.voice_client.is_playing.return_value = True
         voice_handler.stats["messages_played"] = 10
         voice_handler.stats["messages_skipped"] = 2
 
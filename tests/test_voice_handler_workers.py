@@ -0,0 +1,93 @@
+"""Unit tests for VoiceHandler worker startup and supervision."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from discord_voice_bot.config import Config
+from discord_voice_bot.voice.handler import VoiceHandler, _ensure_opus
+
+
+@pytest.fixture
+def voice_handler(config: Config) -> VoiceHandler:
+    """Create a VoiceHandler with a mocked bot client."""
+    return VoiceHandler(MagicMock(), config)
+
+
+class TestOpusCheck:
+    """Test the once-per-process Opus availability check."""
+
+    def test_opus_is_probed_once(self) -> None:
+        """Repeated checks reuse the first result."""
+        _ensure_opus.cache_clear()
+        with patch("discord.opus.is_loaded", return_value=False) as mock_is_loaded, patch("discord.opus.load_opus") as mock_load:
+            assert _ensure_opus() is False
+            assert _ensure_opus() is False
+
+        mock_load.assert_called_once_with("opus")
+        assert mock_is_loaded.call_count == 2
+        _ensure_opus.cache_clear()
+
+
+class TestWorkerSupervision:
+    """Test the supervisor task that owns the workers."""
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_stops_the_others(self, voice_handler: VoiceHandler) -> None:
+        """A worker that raises cancels its siblings instead of leaving them orphaned."""
+        sibling_cancelled = asyncio.Event()
+
+        async def crash() -> None:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        async def idle() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                sibling_cancelled.set()
+                raise
+
+        workers: list[Any] = [Mock(run=crash), Mock(run=idle)]
+        await asyncio.wait_for(voice_handler._supervise(workers), timeout=1)
+
+        assert sibling_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_supervisor_cancels_workers(self, voice_handler: VoiceHandler) -> None:
+        """Cleanup only has to cancel the single supervisor task."""
+        cancelled = asyncio.Event()
+
+        async def idle() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        workers: list[Any] = [Mock(run=idle)]
+        voice_handler.add_worker_task(asyncio.create_task(voice_handler._supervise(workers)))
+        await asyncio.sleep(0)
+
+        await voice_handler.task_manager.cleanup()
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_second_start_does_not_duplicate_workers(self, voice_handler: VoiceHandler) -> None:
+        """Starting again while the workers run must not spawn another pipeline."""
+
+        async def supervise(workers: list[Any]) -> None:
+            await asyncio.sleep(10)
+
+        with patch.object(voice_handler, "_supervise", side_effect=supervise):
+            await voice_handler._start_workers(start_player=False)
+            first_synthesizer = voice_handler.synthesizer
+
+            await voice_handler._start_workers(start_player=False)
+
+        assert len(voice_handler.tasks) == 1
+        assert voice_handler.synthesizer is first_synthesizer
+        await voice_handler.task_manager.cleanup()
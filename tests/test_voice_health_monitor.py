@@ -0,0 +1,67 @@
+"""Unit tests for voice.health_monitor module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from discord_voice_bot.config import Config
+from discord_voice_bot.voice.health_monitor import HealthMonitor
+
+
+@pytest.mark.asyncio
+class TestTTSEngineReuse:
+    """Test that health checks share one TTS engine built from the handler's config."""
+
+    async def test_engine_is_created_once(self, config: Config):
+        engine = MagicMock(health_check=AsyncMock(return_value=True), close=AsyncMock())
+        monitor = HealthMonitor(MagicMock(voice_client=None), config)
+
+        with patch("discord_voice_bot.tts_engine.get_tts_engine", new_callable=AsyncMock, return_value=engine) as mock_get:
+            first = await monitor.perform_health_check()
+            second = await monitor.perform_health_check()
+
+        mock_get.assert_awaited_once_with(config)
+        assert first["can_synthesize"] and second["can_synthesize"]
+
+        await monitor.close()
+        engine.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestCriticalIssues:
+    """Test which issues make the voice system unhealthy."""
+
+    async def test_playing_audio_is_not_critical(self, config: Config):
+        voice_client = MagicMock()
+        voice_client.is_playing.return_value = True
+        monitor = HealthMonitor(MagicMock(voice_client=voice_client), config)
+        monitor._tts_engine = MagicMock(health_check=AsyncMock(return_value=True))
+
+        status = await monitor.perform_health_check()
+
+        assert status["issues"] == ["Audio is currently playing"]
+        assert status["healthy"]
+
+    async def test_missing_voice_client_is_critical(self, config: Config):
+        monitor = HealthMonitor(MagicMock(voice_client=None), config)
+        monitor._tts_engine = MagicMock(health_check=AsyncMock(return_value=True))
+
+        status = await monitor.perform_health_check()
+
+        assert not status["healthy"]
+
+
+@pytest.mark.asyncio
+class TestTTSHealth:
+    """Test that TTS health comes from the engine's own cached probe."""
+
+    async def test_each_check_asks_the_engine(self, config: Config):
+        engine = MagicMock(health_check=AsyncMock(side_effect=[True, False]))
+        monitor = HealthMonitor(MagicMock(voice_client=None), config)
+        monitor._tts_engine = engine
+
+        _ = await monitor.perform_health_check()
+        status = await monitor.perform_health_check()
+
+        assert engine.health_check.await_count == 2
+        assert not status["can_synthesize"]
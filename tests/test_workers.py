@@ -155,9 +155,8 @@ class TestWorkerInitialization:
                 active_tasks = [task for task in voice_handler.tasks if not task.done()]
                 assert len(active_tasks) > 0, "Worker tasks finished immediately"
 
-                # Check that we have the expected number of workers
-                # (SynthesizerWorker + PlayerWorker)
-                assert len(active_tasks) >= 2, f"Expected at least 2 workers, got {len(active_tasks)}"
+                # SynthesizerWorker and PlayerWorker run under a single supervisor task
+                assert len(active_tasks) == 1, f"Expected 1 supervisor task, got {len(active_tasks)}"
 
         except asyncio.TimeoutError:
             pytest.fail("Test timed out - voice_handler_initializes_workers took too long")